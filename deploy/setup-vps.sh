@@ -187,7 +187,7 @@ VPS_USER=root
 VPS_PORT=22
 VPS_REMOTE_PATH=/var/www/html/monitoring
 VPS_SSH_KEY_PATH=/opt/imgserv/.ssh/vps_key
-VPS_RSYNC_OPTIONS=-avz --delete
+VPS_RSYNC_OPTIONS="-aW --delete --partial"
 EOF
     
     log "Camera server configured with root user for VPS sync"
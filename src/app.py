@@ -4,6 +4,7 @@ FastAPI application with security middleware and API endpoints.
 Provides secure web interface for image sequence viewing and management.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -23,7 +24,9 @@ from src.config import Settings
 from src.services.sequence_service import ImageSequenceService
 from src.services.snow_analytics import SnowAnalytics
 from src.services.config_manager import ConfigManager
-from src.templates.config_page import create_config_page_html
+from src.templates.config_page import (
+    config_page_asset, config_page_etag, create_config_page_bytes
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -480,7 +483,9 @@ def create_app(settings: Settings) -> FastAPI:
                         "X-Road-Pixels": str(metadata.get("road_pixels", 0)),
                         "X-Road-Percentage": str(metadata.get("road_percentage", 0)),
                         "X-Contours-Detected": str(metadata.get("contours_detected", 0)),
-                        "X-Timestamp": timestamp.isoformat()
+                        "X-Timestamp": timestamp.isoformat(),
+                        # The config page links this URL without a cache-busting parameter
+                        "Cache-Control": "no-store"
                     }
                 )
             else:
@@ -513,6 +518,24 @@ def create_app(settings: Settings) -> FastAPI:
             raise HTTPException(status_code=500, detail="Failed to generate road boundary visualization")
     
     # Configuration endpoints (CAMERA SERVER ONLY - NOT EXPOSED TO VPS)
+    @app.get("/static/{filename}")
+    @limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+    async def config_page_static(request: Request, filename: str):
+        """Config page stylesheet and script; the page links them with a content-hash version."""
+        gzipped = "gzip" in request.headers.get("accept-encoding", "")
+        asset = config_page_asset(filename, gzipped=gzipped)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Not found")
+        
+        content, media_type = asset
+        headers = {
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Vary": "Accept-Encoding",
+        }
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=content, media_type=media_type, headers=headers)
+    
     @app.get("/config", response_class=HTMLResponse)
     @limiter.limit(f"{settings.rate_limit_per_minute}/minute")
     async def config_page(request: Request):
@@ -527,13 +550,28 @@ def create_app(settings: Settings) -> FastAPI:
             client_ip = request.client.host if request.client else "unknown"
             logger.info("Configuration page accessed", client_ip=client_ip)
             
-            # Initialize config manager
-            config_manager = ConfigManager(settings)
+            # Load config off the event loop; it is the only blocking step
+            # left, since rendered pages are cached
+            config_manager = await asyncio.to_thread(ConfigManager, settings)
             config_data = config_manager.get_config()
             
-            # Generate HTML page
-            html_content = create_config_page_html(config_data)
-            return HTMLResponse(content=html_content)
+            # Let the browser reuse its copy if the config has not changed
+            etag = config_page_etag(config_data)
+            cache_headers = {
+                "ETag": etag,
+                "Cache-Control": "private, must-revalidate",
+                "Vary": "Accept-Encoding",
+            }
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=304, headers=cache_headers)
+            
+            # Generate HTML page; both encodings are rendered once per config
+            gzipped = "gzip" in request.headers.get("accept-encoding", "")
+            if gzipped:
+                cache_headers["Content-Encoding"] = "gzip"
+            html_content = create_config_page_bytes(config_data, gzipped=gzipped)
+            return HTMLResponse(content=html_content, headers=cache_headers)
             
         except Exception as e:
             logger.error("Configuration page error", error=str(e))
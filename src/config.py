@@ -70,7 +70,15 @@ class Settings(BaseSettings):
     vps_port: int = Field(default=22, description="SSH port")
     vps_remote_path: str = Field(default="/var/www/html/monitoring", description="Remote path on VPS")
     vps_ssh_key_path: str = Field(default="/opt/imgserv/.ssh/vps_key", description="SSH private key path")
-    vps_rsync_options: str = Field(default="-avz --delete", description="RSYNC options")
+    # GIFs are small and already LZW-compressed: -W sends them whole (skipping the
+    # delta-transfer rolling checksums) and compression is off unless vps_compress
+    # is set for slow WAN links
+    vps_rsync_options: str = Field(default="-aW --delete --partial", description="RSYNC options")
+    vps_compress: bool = Field(default=False, description="Compress rsync transfers with zstd (WAN-bound links only)")
+    vps_rsync_checksum: bool = Field(default=False, description="Also compare file contents (--checksum) on incremental syncs")
+    vps_rsync_checksum_choice: str = Field(default="", description="RSYNC --checksum-choice, needs rsync >= 3.2 on both ends (empty to use rsync default)")
+    vps_full_sync_interval_seconds: float = Field(default=3600.0, description="Run a full rsync at least this often, repairing files lost on the VPS")
+    vps_sync_debounce_seconds: float = Field(default=2.0, description="Delay to coalesce back-to-back sync requests")
     
     @field_validator("data_dir", "images_dir", "sequences_dir", "log_file")
     @classmethod
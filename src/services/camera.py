@@ -87,19 +87,8 @@ class RTSPCamera:
                 error_msg = stderr.decode('utf-8') if stderr else "Unknown ffmpeg error"
                 raise CameraError(f"ffmpeg failed: {error_msg}")
             
-            # Read the captured image
-            if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
-                raise CameraError("No image data captured")
-            
-            with open(temp_path, 'rb') as f:
-                image_data = f.read()
-            
-            # Validate image
-            try:
-                with Image.open(BytesIO(image_data)) as img:
-                    img.verify()
-            except Exception as e:
-                raise CameraError(f"Invalid image data: {e}")
+            # Read and validate the captured image off the event loop
+            image_data = await asyncio.to_thread(self._read_snapshot, temp_path)
             
             capture_time = datetime.now()
             
@@ -125,6 +114,23 @@ class RTSPCamera:
             except Exception:
                 pass  # Ignore cleanup errors
     
+    @staticmethod
+    def _read_snapshot(temp_path: str) -> bytes:
+        """Read the frame ffmpeg wrote and verify it is a valid image."""
+        if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
+            raise CameraError("No image data captured")
+        
+        with open(temp_path, 'rb') as f:
+            image_data = f.read()
+        
+        try:
+            with Image.open(BytesIO(image_data)) as img:
+                img.verify()
+        except Exception as e:
+            raise CameraError(f"Invalid image data: {e}")
+        
+        return image_data
+    
     async def test_connection(self) -> bool:
         """Test RTSP stream connectivity."""
         try:
@@ -117,10 +117,14 @@ class ImageProcessor:
                 draw.text((margin + 5, margin + 5), location, fill=(255, 255, 255), font=self.font)
                 draw.text((margin + 5, margin + line_height + 10), time_str, fill=(255, 255, 255), font=self.font)
                 
-                # Composite overlay onto image
-                img_rgba = img.convert('RGBA')
-                final_img = Image.alpha_composite(img_rgba, overlay)
-                final_img = final_img.convert('RGB')
+                # Composite overlay onto image; only the region the overlay
+                # covers is converted and blended, the rest is untouched
+                bbox = overlay.getbbox()
+                final_img = img
+                if bbox:
+                    region = img.crop(bbox).convert('RGBA')
+                    blended = Image.alpha_composite(region, overlay.crop(bbox))
+                    final_img.paste(blended.convert('RGB'), bbox[:2])
                 
                 # Save to bytes
                 output = BytesIO()
@@ -154,26 +158,15 @@ class ImageProcessor:
             if not images:
                 raise ValueError("No images provided for sequence")
             
-            processed_images = []
+            frames = []
             
             # Process each image (no timestamp overlay - now handled by analytics overlay)
             for img_data, timestamp in images:
-                # Just resize the image to target dimensions
+                # Decode and resize straight into a GIF frame; no JPEG round trip
                 with Image.open(BytesIO(img_data)) as img:
                     if img.mode != 'RGB':
                         img = img.convert('RGB')
-                    img = img.resize((self.output_width, self.output_height), Image.Resampling.LANCZOS)
-                    
-                    # Save to bytes
-                    output = BytesIO()
-                    img.save(output, format='JPEG', quality=self.image_quality, optimize=True)
-                    processed_images.append(output.getvalue())
-            
-            # Create animated GIF
-            frames = []
-            for img_data in processed_images:
-                with Image.open(BytesIO(img_data)) as img:
-                    frames.append(img.copy())
+                    frames.append(img.resize((self.output_width, self.output_height), Image.Resampling.LANCZOS))
             
             if frames:
                 # Calculate frame duration for 1 FPS (1000ms per frame)
@@ -80,6 +80,9 @@ class ImageSequenceService:
             else:
                 logger.warning("Camera connection test failed - service will start without camera")
             
+            # Establish the VPS SSH connection up front so syncs reuse it
+            await self.vps_sync.start()
+            
             # Start background tasks
             self.capture_task = asyncio.create_task(self._capture_loop())
             
@@ -101,6 +104,11 @@ class ImageSequenceService:
                 except asyncio.CancelledError:
                     pass
             
+            if self.analytics:
+                await self.analytics.close()
+            
+            await self.vps_sync.close()
+            
             logger.info("Image sequence service stopped")
             
         except Exception as e:
@@ -224,15 +232,8 @@ class ImageSequenceService:
                 logger.warning("No recent images available for sequence")
                 return None
             
-            # Load image data
-            images_with_data = []
-            for file_path, timestamp in recent_images:
-                try:
-                    with open(file_path, 'rb') as f:
-                        image_data = f.read()
-                    images_with_data.append((image_data, timestamp))
-                except Exception as e:
-                    logger.warning("Failed to load image", path=str(file_path), error=str(e))
+            # Load image data (read in on-disk order, returned chronologically)
+            images_with_data = await self.storage.load_images(recent_images)
             
             if not images_with_data:
                 logger.warning("No valid images loaded for sequence")
@@ -271,13 +272,8 @@ class ImageSequenceService:
             # Clean up old sequences (keep only the latest 3)
             await self._cleanup_old_sequences()
             
-            # Sync to VPS if enabled
-            if self.vps_sync.enabled:
-                sync_success = await self.vps_sync.sync_to_vps(self.settings.sequences_dir)
-                if sync_success:
-                    logger.info("Sequence synchronized to VPS")
-                else:
-                    logger.warning("VPS synchronization failed")
+            # Sync to VPS if enabled (debounced in the background)
+            self.vps_sync.request_sync(self.settings.sequences_dir)
             
             logger.info("Image sequence generated", path=str(sequence_path))
             return sequence_path
@@ -10,21 +10,54 @@ Implements computer vision-based snow load detection and analysis using:
 
 import asyncio
 import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import json
 
 import cv2
 import numpy as np
+import orjson
 from PIL import Image, ImageDraw, ImageFont
 import structlog
 import aiohttp
 
 from src.config import Settings
+from src.utils.logging import setup_logging
 
 logger = structlog.get_logger(__name__)
 
+# Analysis does not need full camera resolution; libjpeg can decode at 1/2
+# scale directly in the DCT domain, which is much cheaper than a full decode.
+_ANALYSIS_DECODE_FLAG = cv2.IMREAD_REDUCED_COLOR_2
+_ANALYSIS_DECODE_SCALE = 2
+
+# Road analysis fields holding absolute pixel counts (rescaled to full resolution)
+_PIXEL_COUNT_FIELDS = ("road_pixels", "snow_pixels", "wet_pixels", "ice_pixels")
+
+# HSV ranges for snow (bright, unsaturated) and ice (bright, very low saturation)
+_SNOW_HSV_RANGE = ((0, 0, 200), (180, 30, 255))
+_ICE_HSV_RANGE = ((0, 0, 180), (180, 15, 220))
+
+# One JSON object per line in the history log; numpy scalars serialize natively
+_HISTORY_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+# Above this temperature (F) with no precipitation and no snow on the ground,
+# snow/ice cannot be present and the vision pipeline is skipped
+_FAST_PATH_MIN_TEMPERATURE = 40
+
+
+def _cuda_available() -> bool:
+    """Check whether OpenCV was built with CUDA and a device is present."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
 
 class SnowAnalyticsError(Exception):
     """Snow analytics related errors."""
@@ -38,134 +71,164 @@ class WeatherDataClient:
         self.settings = settings
         self.cache_duration = 60  # 1 minute (reduced for debugging)
         self._cache = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession()
+            return self._session
+    
+    async def close(self):
+        """Cancel in-flight fetches and close the shared HTTP session."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def get_current_weather(self, lat: float = 40.0, lon: float = -74.0) -> Dict:
         """Get current weather data from NOAA API with snow depth and accumulation."""
         cache_key = f"weather_{lat}_{lon}"
-        now = datetime.now()
         
         # Check cache
         if cache_key in self._cache:
-            cached_data, timestamp = self._cache[cache_key]
-            if (now - timestamp).seconds < self.cache_duration:
+            cached_data, expires_at = self._cache[cache_key]
+            if time.monotonic() < expires_at:
                 return cached_data
         
+        # Share a single request between concurrent callers for the same location.
+        # The fetch runs in its own task, so a caller that is cancelled stops
+        # waiting without cancelling the fetch for the others.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_current_weather(lat, lon, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch_current_weather(self, lat: float, lon: float, cache_key: str) -> Dict:
+        """Fetch current conditions from NOAA and populate the cache."""
+        now = datetime.now()
         try:
             # Use NOAA API for weather data
             url = f"https://api.weather.gov/points/{lat},{lon}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Extract current conditions from NOAA API
-                        weather_data = {
-                            "temperature": 45,  # More realistic default for Utah
-                            "precipitation_rate": 0.0,
-                            "snow_depth_inches": 0.0,
-                            "snow_accumulation_1hr": 0.0,
-                            "snow_accumulation_3hr": 0.0,
-                            "snow_accumulation_6hr": 0.0,
-                            "humidity": 45,
-                            "conditions": "Clear",
-                            "wind_speed": 0,
-                            "wind_direction": "N",
-                            "timestamp": now.isoformat(),
-                            "source": "NOAA"
-                        }
-                        
-                        logger.info("Fetching weather data", lat=lat, lon=lon, url=url)
-                        
-                        # Try to extract real weather data from NOAA response
-                        try:
-                            # Get forecast data
-                            if "properties" in data and "forecast" in data["properties"]:
-                                forecast_url = data["properties"]["forecast"]
-                                async with session.get(forecast_url) as forecast_response:
-                                    if forecast_response.status == 200:
-                                        forecast_data = await forecast_response.json()
-                                        if "properties" in forecast_data and "periods" in forecast_data["properties"]:
-                                            current_period = forecast_data["properties"]["periods"][0]
-                                            forecast_temp = current_period.get("temperature", 45)
-                                            weather_data.update({
-                                                "temperature": forecast_temp,
-                                                "conditions": current_period.get("shortForecast", "Clear"),
-                                                "wind_speed": current_period.get("windSpeed", "0 mph").split()[0],
-                                                "wind_direction": current_period.get("windDirection", "N")
-                                            })
-                                            logger.info("Parsed forecast temperature", forecast_temp=forecast_temp, period_name=current_period.get("name", "Unknown"))
-                            
-                            # Get observation station data for current conditions
-                            if "properties" in data and "observationStations" in data["properties"]:
-                                stations_url = data["properties"]["observationStations"]
-                                async with session.get(stations_url) as stations_response:
-                                    if stations_response.status == 200:
-                                        stations_data = await stations_response.json()
-                                        if "features" in stations_data and len(stations_data["features"]) > 0:
-                                            # Get the closest station
-                                            station_id = stations_data["features"][0]["properties"]["stationIdentifier"]
-                                            obs_url = f"https://api.weather.gov/stations/{station_id}/observations/latest"
-                                            
-                                            async with session.get(obs_url) as obs_response:
-                                                if obs_response.status == 200:
-                                                    obs_data = await obs_response.json()
-                                                    if "properties" in obs_data:
-                                                        props = obs_data["properties"]
-                                                        
-                                                        # Extract temperature (in Celsius, convert to Fahrenheit)
-                                                        if props.get("temperature", {}).get("value"):
-                                                            temp_c = props["temperature"]["value"]
-                                                            temp_f = round((temp_c * 9/5) + 32, 1)
-                                                            weather_data["temperature"] = temp_f
-                                                            logger.info("Parsed temperature from NOAA", temp_c=temp_c, temp_f=temp_f, station_id=station_id)
-                                                        
-                                                        # Extract humidity
-                                                        if props.get("relativeHumidity", {}).get("value"):
-                                                            weather_data["humidity"] = round(props["relativeHumidity"]["value"], 0)
-                                                        
-                                                        # Extract snow depth (in meters, convert to inches)
-                                                        if props.get("snowDepth", {}).get("value"):
-                                                            depth_m = props["snowDepth"]["value"]
-                                                            weather_data["snow_depth_inches"] = round(depth_m * 39.3701, 1)
-                                                        
-                                                        # Extract precipitation
-                                                        if props.get("precipitationLastHour", {}).get("value"):
-                                                            precip_mm = props["precipitationLastHour"]["value"]
-                                                            weather_data["precipitation_rate"] = round(precip_mm * 0.0393701, 2)
-                                                        
-                                                        # Extract wind speed (m/s to mph)
-                                                        if props.get("windSpeed", {}).get("value"):
-                                                            wind_ms = props["windSpeed"]["value"]
-                                                            weather_data["wind_speed"] = round(wind_ms * 2.23694, 1)
-                                                        
-                                                        # Extract wind direction
-                                                        if props.get("windDirection", {}).get("value"):
-                                                            weather_data["wind_direction"] = self._degrees_to_cardinal(
-                                                                props["windDirection"]["value"]
-                                                            )
-                                                        
-                                                        # Extract conditions
-                                                        if props.get("textDescription"):
-                                                            weather_data["conditions"] = props["textDescription"]
-                        
-                        except Exception as e:
-                            logger.debug("Could not parse detailed weather data", error=str(e))
-                        
-                        # Estimate snow accumulation based on precipitation and temperature
-                        if weather_data["temperature"] <= 32 and weather_data["precipitation_rate"] > 0:
-                            # Rough estimation: 1 inch of rain = ~10 inches of snow
-                            weather_data["snow_accumulation_1hr"] = round(weather_data["precipitation_rate"] * 10, 1)
-                            weather_data["snow_accumulation_3hr"] = round(weather_data["snow_accumulation_1hr"] * 3, 1)
-                            weather_data["snow_accumulation_6hr"] = round(weather_data["snow_accumulation_1hr"] * 6, 1)
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    
+                    # Extract current conditions from NOAA API
+                    weather_data = {
+                        "temperature": 45,  # More realistic default for Utah
+                        "precipitation_rate": 0.0,
+                        "snow_depth_inches": 0.0,
+                        "snow_accumulation_1hr": 0.0,
+                        "snow_accumulation_3hr": 0.0,
+                        "snow_accumulation_6hr": 0.0,
+                        "humidity": 45,
+                        "conditions": "Clear",
+                        "wind_speed": 0,
+                        "wind_direction": "N",
+                        "timestamp": now.isoformat(),
+                        "source": "NOAA"
+                    }
+                    
+                    logger.info("Fetching weather data", lat=lat, lon=lon, url=url)
+                    
+                    # Try to extract real weather data from NOAA response
+                    try:
+                        # Get forecast data
+                        if "properties" in data and "forecast" in data["properties"]:
+                            forecast_url = data["properties"]["forecast"]
+                            async with session.get(forecast_url) as forecast_response:
+                                if forecast_response.status == 200:
+                                    forecast_data = await forecast_response.json(loads=orjson.loads)
+                                    if "properties" in forecast_data and "periods" in forecast_data["properties"]:
+                                        current_period = forecast_data["properties"]["periods"][0]
+                                        forecast_temp = current_period.get("temperature", 45)
+                                        weather_data.update({
+                                            "temperature": forecast_temp,
+                                            "conditions": current_period.get("shortForecast", "Clear"),
+                                            "wind_speed": current_period.get("windSpeed", "0 mph").split()[0],
+                                            "wind_direction": current_period.get("windDirection", "N")
+                                        })
+                                        logger.info("Parsed forecast temperature", forecast_temp=forecast_temp, period_name=current_period.get("name", "Unknown"))
                         
-                        # Cache the result
-                        self._cache[cache_key] = (weather_data, now)
-                        logger.info("Returning weather data", temperature=weather_data["temperature"], source=weather_data["source"], lat=lat, lon=lon)
-                        return weather_data
-                    else:
-                        logger.warning("Weather API request failed", status=response.status)
-                        return self._get_fallback_weather()
+                        # Get observation station data for current conditions
+                        if "properties" in data and "observationStations" in data["properties"]:
+                            stations_url = data["properties"]["observationStations"]
+                            async with session.get(stations_url) as stations_response:
+                                if stations_response.status == 200:
+                                    stations_data = await stations_response.json(loads=orjson.loads)
+                                    if "features" in stations_data and len(stations_data["features"]) > 0:
+                                        # Get the closest station
+                                        station_id = stations_data["features"][0]["properties"]["stationIdentifier"]
+                                        obs_url = f"https://api.weather.gov/stations/{station_id}/observations/latest"
+                                        
+                                        async with session.get(obs_url) as obs_response:
+                                            if obs_response.status == 200:
+                                                obs_data = await obs_response.json(loads=orjson.loads)
+                                                if "properties" in obs_data:
+                                                    props = obs_data["properties"]
+                                                    
+                                                    # Extract temperature (in Celsius, convert to Fahrenheit)
+                                                    if props.get("temperature", {}).get("value"):
+                                                        temp_c = props["temperature"]["value"]
+                                                        temp_f = round((temp_c * 9/5) + 32, 1)
+                                                        weather_data["temperature"] = temp_f
+                                                        logger.info("Parsed temperature from NOAA", temp_c=temp_c, temp_f=temp_f, station_id=station_id)
+                                                    
+                                                    # Extract humidity
+                                                    if props.get("relativeHumidity", {}).get("value"):
+                                                        weather_data["humidity"] = round(props["relativeHumidity"]["value"], 0)
+                                                    
+                                                    # Extract snow depth (in meters, convert to inches)
+                                                    if props.get("snowDepth", {}).get("value"):
+                                                        depth_m = props["snowDepth"]["value"]
+                                                        weather_data["snow_depth_inches"] = round(depth_m * 39.3701, 1)
+                                                    
+                                                    # Extract precipitation
+                                                    if props.get("precipitationLastHour", {}).get("value"):
+                                                        precip_mm = props["precipitationLastHour"]["value"]
+                                                        weather_data["precipitation_rate"] = round(precip_mm * 0.0393701, 2)
+                                                    
+                                                    # Extract wind speed (m/s to mph)
+                                                    if props.get("windSpeed", {}).get("value"):
+                                                        wind_ms = props["windSpeed"]["value"]
+                                                        weather_data["wind_speed"] = round(wind_ms * 2.23694, 1)
+                                                    
+                                                    # Extract wind direction
+                                                    if props.get("windDirection", {}).get("value"):
+                                                        weather_data["wind_direction"] = self._degrees_to_cardinal(
+                                                            props["windDirection"]["value"]
+                                                        )
+                                                    
+                                                    # Extract conditions
+                                                    if props.get("textDescription"):
+                                                        weather_data["conditions"] = props["textDescription"]
+                    
+                    except Exception as e:
+                        logger.debug("Could not parse detailed weather data", error=str(e))
+                    
+                    # Estimate snow accumulation based on precipitation and temperature
+                    if weather_data["temperature"] <= 32 and weather_data["precipitation_rate"] > 0:
+                        # Rough estimation: 1 inch of rain = ~10 inches of snow
+                        weather_data["snow_accumulation_1hr"] = round(weather_data["precipitation_rate"] * 10, 1)
+                        weather_data["snow_accumulation_3hr"] = round(weather_data["snow_accumulation_1hr"] * 3, 1)
+                        weather_data["snow_accumulation_6hr"] = round(weather_data["snow_accumulation_1hr"] * 6, 1)
+                    
+                    # Cache the result
+                    self._cache[cache_key] = (weather_data, time.monotonic() + self.cache_duration)
+                    logger.info("Returning weather data", temperature=weather_data["temperature"], source=weather_data["source"], lat=lat, lon=lon)
+                    return weather_data
+                else:
+                    logger.warning("Weather API request failed", status=response.status)
+                    return self._get_fallback_weather()
         
         except Exception as e:
             logger.warning("Weather data fetch failed", error=str(e))
@@ -201,50 +264,50 @@ class WeatherDataClient:
         
         try:
             url = f"https://api.weather.gov/points/{lat},{lon}"
-            async with aiohttp.ClientSession() as session:
-                # Get forecast endpoint
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return alerts
-                    data = await response.json()
-                    forecast_url = data["properties"]["forecast"]
+            session = await self._get_session()
+            # Get forecast endpoint
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return alerts
+                data = await response.json(loads=orjson.loads)
+                forecast_url = data["properties"]["forecast"]
+            
+            # Get hourly forecast
+            async with session.get(forecast_url) as response:
+                if response.status != 200:
+                    return alerts
+                forecast_data = await response.json(loads=orjson.loads)
+                periods = forecast_data["properties"]["periods"][:24]  # Next 24 hours
                 
-                # Get hourly forecast
-                async with session.get(forecast_url) as response:
-                    if response.status != 200:
-                        return alerts
-                    forecast_data = await response.json()
-                    periods = forecast_data["properties"]["periods"][:24]  # Next 24 hours
+                for period in periods:
+                    forecast = period.get("shortForecast", "").lower()
+                    temp = period.get("temperature", 50)
+                    start_time = period.get("startTime", "")
                     
-                    for period in periods:
-                        forecast = period.get("shortForecast", "").lower()
-                        temp = period.get("temperature", 50)
-                        start_time = period.get("startTime", "")
-                        
-                        # Parse time to get specific hour
-                        try:
-                            from datetime import datetime
-                            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                            time_str = start_dt.strftime("%I:%M %p")
-                        except:
-                            time_str = "Unknown time"
-                        
-                        # Check for snow predictions
-                        if "snow" in forecast:
-                            if "heavy" in forecast or "significant" in forecast:
-                                alerts.append(f"Heavy snow expected at {time_str}")
-                            elif "light" in forecast:
-                                alerts.append(f"Light snow expected at {time_str}")
-                            else:
-                                alerts.append(f"Moderate snow expected at {time_str}")
-                        
-                        # Check for ice conditions
-                        elif temp <= 32 and ("rain" in forecast or "precip" in forecast):
-                            alerts.append(f"Ice possible at {time_str}")
-                
-                # If no snow alerts, add "No snow expected" message
-                if not any("snow" in alert.lower() for alert in alerts):
-                    alerts.append("No snow expected in next 24 hours")
+                    # Parse time to get specific hour
+                    try:
+                        from datetime import datetime
+                        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                        time_str = start_dt.strftime("%I:%M %p")
+                    except:
+                        time_str = "Unknown time"
+                    
+                    # Check for snow predictions
+                    if "snow" in forecast:
+                        if "heavy" in forecast or "significant" in forecast:
+                            alerts.append(f"Heavy snow expected at {time_str}")
+                        elif "light" in forecast:
+                            alerts.append(f"Light snow expected at {time_str}")
+                        else:
+                            alerts.append(f"Moderate snow expected at {time_str}")
+                    
+                    # Check for ice conditions
+                    elif temp <= 32 and ("rain" in forecast or "precip" in forecast):
+                        alerts.append(f"Ice possible at {time_str}")
+            
+            # If no snow alerts, add "No snow expected" message
+            if not any("snow" in alert.lower() for alert in alerts):
+                alerts.append("No snow expected in next 24 hours")
         
         except Exception as e:
             logger.warning("Failed to get forecast alerts", error=str(e))
@@ -263,44 +326,44 @@ class WeatherDataClient:
         
         try:
             url = f"https://api.weather.gov/points/{lat},{lon}"
-            async with aiohttp.ClientSession() as session:
-                # Get forecast endpoint
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return chart_data
-                    data = await response.json()
-                    forecast_url = data["properties"]["forecast"]
+            session = await self._get_session()
+            # Get forecast endpoint
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return chart_data
+                data = await response.json(loads=orjson.loads)
+                forecast_url = data["properties"]["forecast"]
+            
+            # Get hourly forecast
+            async with session.get(forecast_url) as response:
+                if response.status != 200:
+                    return chart_data
+                forecast_data = await response.json(loads=orjson.loads)
+                periods = forecast_data["properties"]["periods"][:12]  # Next 12 hours
                 
-                # Get hourly forecast
-                async with session.get(forecast_url) as response:
-                    if response.status != 200:
-                        return chart_data
-                    forecast_data = await response.json()
-                    periods = forecast_data["properties"]["periods"][:12]  # Next 12 hours
+                for i, period in enumerate(periods):
+                    forecast = period.get("shortForecast", "").lower()
+                    temp = period.get("temperature", 50)
                     
-                    for i, period in enumerate(periods):
-                        forecast = period.get("shortForecast", "").lower()
-                        temp = period.get("temperature", 50)
-                        
-                        # Calculate snow probability based on forecast text
-                        snow_prob = 0
-                        if "heavy" in forecast and "snow" in forecast:
-                            snow_prob = 90
-                        elif "moderate" in forecast and "snow" in forecast:
-                            snow_prob = 70
-                        elif "light" in forecast and "snow" in forecast:
-                            snow_prob = 50
-                        elif "snow" in forecast:
-                            snow_prob = 60
-                        elif "snow showers" in forecast:
-                            snow_prob = 40
-                        elif "snow" in forecast and "possible" in forecast:
-                            snow_prob = 30
-                        
-                        chart_data["hours"].append(f"{i+1}h")
-                        chart_data["snow_probability"].append(snow_prob)
-                        chart_data["temperature"].append(temp)
-                        chart_data["conditions"].append(period.get("shortForecast", "Clear"))
+                    # Calculate snow probability based on forecast text
+                    snow_prob = 0
+                    if "heavy" in forecast and "snow" in forecast:
+                        snow_prob = 90
+                    elif "moderate" in forecast and "snow" in forecast:
+                        snow_prob = 70
+                    elif "light" in forecast and "snow" in forecast:
+                        snow_prob = 50
+                    elif "snow" in forecast:
+                        snow_prob = 60
+                    elif "snow showers" in forecast:
+                        snow_prob = 40
+                    elif "snow" in forecast and "possible" in forecast:
+                        snow_prob = 30
+                    
+                    chart_data["hours"].append(f"{i+1}h")
+                    chart_data["snow_probability"].append(snow_prob)
+                    chart_data["temperature"].append(temp)
+                    chart_data["conditions"].append(period.get("shortForecast", "Clear"))
         
         except Exception as e:
             logger.warning("Failed to get snow probability chart", error=str(e))
@@ -316,6 +379,15 @@ class RoadDetector:
         self.roi_points = None  # Region of Interest points
         self.roi_mask = None
     
+    def get_roi_points(self) -> Optional[List]:
+        """Return the custom ROI polygon (normalized 0-1 coordinates), if enabled."""
+        if self.config_manager:
+            config = self.config_manager.get_config()
+            if config.get("road_roi_enabled") and config.get("road_roi_points"):
+                return config["road_roi_points"]
+            return None
+        return self.roi_points
+    
     def detect_road_boundaries(self, image: np.ndarray) -> np.ndarray:
         """
         Detect road boundaries using edge detection.
@@ -331,19 +403,17 @@ class RoadDetector:
             height, width = image.shape[:2]
             
             # Check if custom ROI is configured
-            if self.config_manager:
-                config = self.config_manager.get_config()
-                if config.get("road_roi_enabled") and config.get("road_roi_points"):
-                    roi_normalized = config["road_roi_points"]
-                    # Convert normalized (0-1) to pixel coordinates
-                    road_region = np.array([
-                        [int(p[0] * width), int(p[1] * height)] 
-                        for p in roi_normalized
-                    ], np.int32)
-                    
-                    road_mask = np.zeros((height, width), dtype=np.uint8)
-                    cv2.fillPoly(road_mask, [road_region], 255)
-                    return road_mask
+            roi_normalized = self.get_roi_points()
+            if roi_normalized:
+                # Convert normalized (0-1) to pixel coordinates
+                road_region = np.array([
+                    [int(p[0] * width), int(p[1] * height)] 
+                    for p in roi_normalized
+                ], np.int32)
+                
+                road_mask = np.zeros((height, width), dtype=np.uint8)
+                cv2.fillPoly(road_mask, [road_region], 255)
+                return road_mask
             
             # Fall back to existing hardcoded logic if no custom ROI
             # Convert to grayscale
@@ -435,10 +505,38 @@ class RoadDetector:
 class RoadSurfaceAnalyzer:
     """Analyzes road surface conditions using computer vision."""
     
-    def __init__(self):
+    def __init__(self, use_cuda: bool = False):
         self.snow_threshold = 0.7  # Threshold for snow detection
         self.baseline_image = None
         self.baseline_timestamp = None
+        self.use_cuda = use_cuda
+    
+    def _color_stage_cpu(self, image: np.ndarray, road_mask: np.ndarray) -> Tuple[np.ndarray, int, int]:
+        """Convert to HSV, apply the road mask and count snow/ice pixels on the CPU."""
+        hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
+        masked_hsv = cv2.bitwise_and(hsv, hsv, mask=road_mask)
+        snow_mask = cv2.inRange(masked_hsv, np.array(_SNOW_HSV_RANGE[0]), np.array(_SNOW_HSV_RANGE[1]))
+        ice_mask = cv2.inRange(masked_hsv, np.array(_ICE_HSV_RANGE[0]), np.array(_ICE_HSV_RANGE[1]))
+        return masked_hsv, cv2.countNonZero(snow_mask), cv2.countNonZero(ice_mask)
+    
+    def _color_stage_cuda(self, image: np.ndarray, road_mask: np.ndarray) -> Tuple[np.ndarray, int, int]:
+        """
+        GPU variant of the colour stage.
+        
+        The frame and mask are uploaded once; only the masked HSV image (needed
+        by the CPU wetness/texture stages) and the two pixel counts come back.
+        """
+        gpu_image = cv2.cuda_GpuMat()
+        gpu_image.upload(image)
+        gpu_mask = cv2.cuda_GpuMat()
+        gpu_mask.upload(road_mask)
+        
+        gpu_hsv = cv2.cuda.cvtColor(gpu_image, cv2.COLOR_RGB2HSV)
+        gpu_masked = cv2.cuda.bitwise_and(gpu_hsv, gpu_hsv, mask=gpu_mask)
+        
+        snow_pixels = cv2.cuda.countNonZero(cv2.cuda.inRange(gpu_masked, *_SNOW_HSV_RANGE))
+        ice_pixels = cv2.cuda.countNonZero(cv2.cuda.inRange(gpu_masked, *_ICE_HSV_RANGE))
+        return gpu_masked.download(), snow_pixels, ice_pixels
     
     def analyze_road_surface(self, image: np.ndarray, road_mask: np.ndarray, temperature: float = 70, hour: int = 12) -> Dict:
         """
@@ -454,24 +552,21 @@ class RoadSurfaceAnalyzer:
             Dictionary with road surface analysis results
         """
         try:
-            # Convert to HSV for better color analysis
-            hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
+            # Convert to HSV, apply road mask and count snow/ice pixels
+            # (snow: high value, low saturation; ice: bright with very low saturation)
+            if self.use_cuda:
+                try:
+                    masked_hsv, snow_pixels, ice_pixels = self._color_stage_cuda(image, road_mask)
+                except cv2.error as e:
+                    logger.warning("CUDA colour stage failed, falling back to CPU", error=str(e))
+                    self.use_cuda = False
+            if not self.use_cuda:
+                masked_hsv, snow_pixels, ice_pixels = self._color_stage_cpu(image, road_mask)
             
-            # Apply road mask
-            masked_hsv = cv2.bitwise_and(hsv, hsv, mask=road_mask)
             masked_rgb = cv2.bitwise_and(image, image, mask=road_mask)
             
-            # Define snow color range (white/light colors)
-            # Snow typically has high value (brightness) and low saturation
-            lower_snow = np.array([0, 0, 200])  # Low hue, low sat, high value
-            upper_snow = np.array([180, 30, 255])  # High hue, low sat, high value
-            
-            # Create snow mask
-            snow_mask = cv2.inRange(masked_hsv, lower_snow, upper_snow)
-            
             # Calculate snow coverage percentage
-            road_pixels = np.sum(road_mask > 0)
-            snow_pixels = np.sum(snow_mask > 0)
+            road_pixels = cv2.countNonZero(road_mask)
             
             if road_pixels > 0:
                 snow_coverage = snow_pixels / road_pixels
@@ -507,10 +602,6 @@ class RoadSurfaceAnalyzer:
             wet_coverage = wet_pixels / road_pixels if road_pixels > 0 else 0.0
             
             # Analyze ice potential (very bright, low saturation, specific reflectivity)
-            lower_ice = np.array([0, 0, 180])
-            upper_ice = np.array([180, 15, 220])
-            ice_mask = cv2.inRange(masked_hsv, lower_ice, upper_ice)
-            ice_pixels = np.sum(ice_mask > 0)
             ice_coverage = ice_pixels / road_pixels if road_pixels > 0 else 0.0
             
             # Analyze overall road brightness (cleanliness indicator)
@@ -572,6 +663,113 @@ class RoadSurfaceAnalyzer:
             return "Clear"  # Clear/dry road
 
 
+def _rescale_pixel_counts(road_analysis: Dict, scale: int):
+    """Scale absolute pixel counts from a reduced decode back to full resolution."""
+    factor = scale * scale
+    for field in _PIXEL_COUNT_FIELDS:
+        if field in road_analysis:
+            road_analysis[field] = int(road_analysis[field] * factor)
+
+
+def _clear_road_analysis() -> Dict:
+    """Road analysis result for conditions where snow and ice are impossible."""
+    return {
+        "snow_coverage": 0.0,
+        "wet_coverage": 0.0,
+        "ice_coverage": 0.0,
+        "road_brightness": 0.0,
+        "texture_variance": 0.0,
+        "road_pixels": 0,
+        "snow_pixels": 0,
+        "wet_pixels": 0,
+        "ice_pixels": 0,
+        "surface_condition": "Clear",
+        "confidence": 0.0,
+        "fast_path": True
+    }
+
+
+def _weather_rules_out_snow(weather_data: Dict) -> bool:
+    """Whether live weather data alone shows the road cannot hold snow or ice."""
+    # Fallback data is made up when the weather API fails; never trust it here
+    if weather_data.get("source") == "fallback":
+        return False
+    temperature = weather_data.get("temperature")
+    return (
+        temperature is not None
+        and temperature > _FAST_PATH_MIN_TEMPERATURE
+        and weather_data.get("precipitation_rate") == 0
+        and weather_data.get("snow_depth_inches") == 0
+    )
+
+
+# Road surface analyzer reused for every frame analyzed in this process, so a
+# CUDA fallback (use_cuda reset to False) sticks instead of being retried per frame
+_analyzer: Optional[RoadSurfaceAnalyzer] = None
+
+# Road detector reused the same way; the ROI is passed in with each frame
+_detector = RoadDetector()
+
+
+def _init_analysis_worker(log_level: str):
+    """Set up logging and the analyzer in a pool worker; the parent's log listener is not shared."""
+    global _analyzer
+    setup_logging(log_level, queued=False)
+    _analyzer = RoadSurfaceAnalyzer()
+
+
+def _analyze_image_sync(
+    image_data: bytes,
+    roi_points: Optional[List],
+    temperature: float,
+    hour: int,
+    use_cuda: bool = False
+) -> Dict:
+    """
+    CPU-bound part of SnowAnalytics image analysis.
+    
+    Kept at module level so it can be dispatched to a process pool.
+    
+    Args:
+        image_data: Encoded (JPEG) image bytes
+        roi_points: Custom ROI polygon (normalized), or None for default detection
+        temperature: Current temperature in Fahrenheit
+        hour: Hour of capture (0-23)
+        use_cuda: Run the colour stage on the GPU; only read when this
+            process's analyzer is first created
+        
+    Returns:
+        Road surface analysis dictionary
+    """
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = RoadSurfaceAnalyzer(use_cuda=use_cuda)
+    
+    # Decode image at reduced resolution
+    image = cv2.imdecode(np.frombuffer(image_data, np.uint8), _ANALYSIS_DECODE_FLAG)
+    if image is None:
+        raise SnowAnalyticsError("Could not decode image data")
+    
+    # Convert BGR to RGB
+    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    
+    # Detect road boundaries
+    _detector.roi_points = roi_points
+    road_mask = _detector.detect_road_boundaries(image_rgb)
+    
+    # Analyze road surface with environmental context
+    road_analysis = _analyzer.analyze_road_surface(
+        image_rgb, road_mask,
+        temperature=temperature,
+        hour=hour
+    )
+    
+    # Report pixel counts in full-resolution units
+    _rescale_pixel_counts(road_analysis, _ANALYSIS_DECODE_SCALE)
+    
+    return road_analysis
+
+
 class SnowAnalytics:
     """Main snow analytics service."""
     
@@ -580,18 +778,42 @@ class SnowAnalytics:
         self.weather_client = WeatherDataClient(settings)
         from src.services.config_manager import ConfigManager
         config_manager = ConfigManager(settings)
+        # Not used for analysis itself (that runs in the workers); supplies the
+        # configured ROI to them and draws the road overlay for the API
         self.road_detector = RoadDetector(config_manager=config_manager)
-        self.road_analyzer = RoadSurfaceAnalyzer()
+        
+        # Offload the colour stage to the GPU when OpenCV has CUDA support
+        self._have_cuda = _cuda_available()
+        
+        # Worker processes for the CPU-bound part of image analysis, started on
+        # demand. Spawned rather than forked so workers do not inherit the
+        # parent's threads and queue-based log handler. GPU builds keep one CUDA
+        # context in this process and use the default thread pool.
+        self._pool = None if self._have_cuda else ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_analysis_worker,
+            initargs=(settings.log_level,)
+        )
+        
+        # Number of analyses short-circuited because the weather rules out snow
+        self._fast_paths = 0
         
         # Analytics data storage
         self.analytics_dir = Path(settings.data_dir) / "analytics"
-        self.analytics_dir.mkdir(exist_ok=True)
+        self.analytics_dir.mkdir(parents=True, exist_ok=True)
         
         # Historical data
-        self.historical_data = []
         self.max_history = 100  # Keep last 100 measurements
+        self.historical_data: deque = deque(maxlen=self.max_history)
+        # Capture times of historical_data entries, kept as datetimes to avoid re-parsing
+        self._timestamps: deque = deque(maxlen=self.max_history)
+        self._history_file = self.analytics_dir / "historical_data.jsonl"
+        self._history_buffer: List[bytes] = []
+        self._history_flush_every = 10
+        self._load_historical_data()
         
-        logger.info("Snow analytics service initialized")
+        logger.info("Snow analytics service initialized", cuda=self._have_cuda)
     
     async def analyze_raw_image(self, image_data: bytes, timestamp: datetime) -> Dict:
         """
@@ -605,20 +827,6 @@ class SnowAnalytics:
             Dictionary with complete analysis results
         """
         try:
-            # Convert raw bytes to numpy array
-            image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
-            if image is None:
-                raise SnowAnalyticsError("Could not decode raw image data")
-            
-            # Convert BGR to RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Detect road boundaries
-            road_mask = self.road_detector.detect_road_boundaries(image_rgb)
-            
-            # Get current hour for time-based analysis
-            current_hour = timestamp.hour
-            
             # Get weather data (includes real snow depth and temperature)
             weather_data = await self.weather_client.get_current_weather(
                 lat=self.settings.weather_latitude,
@@ -637,12 +845,23 @@ class SnowAnalytics:
                 lon=self.settings.weather_longitude
             )
             
-            # Analyze road surface with environmental context
-            road_analysis = self.road_analyzer.analyze_road_surface(
-                image_rgb, road_mask, 
-                temperature=weather_data.get("temperature", 70),
-                hour=current_hour
-            )
+            if _weather_rules_out_snow(weather_data):
+                # Warm, dry and no snow on the ground: skip decoding and road/snow detection
+                road_analysis = _clear_road_analysis()
+                self._fast_paths += 1
+            else:
+                # Decode at reduced resolution, detect the road and analyze its
+                # surface off the event loop
+                loop = asyncio.get_running_loop()
+                road_analysis = await loop.run_in_executor(
+                    self._pool,
+                    _analyze_image_sync,
+                    image_data,
+                    self.road_detector.get_roi_points(),
+                    weather_data.get("temperature", 70),
+                    timestamp.hour,
+                    self._have_cuda
+                )
             
             # Calculate accumulation rate from weather data
             accumulation_rate = self._calculate_accumulation_rate(weather_data)
@@ -671,8 +890,7 @@ class SnowAnalytics:
             
             # Store in historical data
             self.historical_data.append(analysis_result)
-            if len(self.historical_data) > self.max_history:
-                self.historical_data.pop(0)
+            self._timestamps.append(timestamp)
             
             logger.info("Raw image analysis completed", 
                        surface_condition=road_analysis["surface_condition"],
@@ -697,35 +915,29 @@ class SnowAnalytics:
             Dictionary with complete analysis results
         """
         try:
-            # Load image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                raise SnowAnalyticsError(f"Could not load image: {image_path}")
-            
-            # Convert BGR to RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Detect road boundaries
-            road_mask = self.road_detector.detect_road_boundaries(image_rgb)
-            
-            # Get current hour for time-based analysis
-            current_hour = timestamp.hour
-            
-            # Analyze road surface conditions (from camera image)
-            road_analysis = self.road_analyzer.analyze_road_surface(image_rgb, road_mask)
-            
             # Get weather data (includes real snow depth and temperature)
             weather_data = await self.weather_client.get_current_weather(
                 lat=self.settings.weather_latitude,
                 lon=self.settings.weather_longitude
             )
             
-            # Re-analyze road surface with environmental context
-            road_analysis = self.road_analyzer.analyze_road_surface(
-                image_rgb, road_mask, 
-                temperature=weather_data.get("temperature", 70),
-                hour=current_hour
-            )
+            if _weather_rules_out_snow(weather_data):
+                # Warm, dry and no snow on the ground: skip road/snow detection entirely
+                road_analysis = _clear_road_analysis()
+                self._fast_paths += 1
+            else:
+                # Run the computer vision pipeline off the event loop
+                image_data = await asyncio.to_thread(Path(image_path).read_bytes)
+                loop = asyncio.get_running_loop()
+                road_analysis = await loop.run_in_executor(
+                    self._pool,
+                    _analyze_image_sync,
+                    image_data,
+                    self.road_detector.get_roi_points(),
+                    weather_data.get("temperature", 70),
+                    timestamp.hour,
+                    self._have_cuda
+                )
             
             # Calculate accumulation rate from weather data
             accumulation_rate = self._calculate_accumulation_rate(weather_data)
@@ -751,7 +963,7 @@ class SnowAnalytics:
             }
             
             # Store historical data
-            self._store_historical_data(analysis_result)
+            self._store_historical_data(analysis_result, timestamp)
             
             logger.info("Image analysis completed", 
                        surface_condition=road_analysis["surface_condition"],
@@ -797,11 +1009,10 @@ class SnowAnalytics:
         
         try:
             # Get last two measurements
-            recent_data = self.historical_data[-2:]
+            recent_data = (self.historical_data[-2], self.historical_data[-1])
             
             # Calculate time difference
-            time1 = datetime.fromisoformat(recent_data[0]["timestamp"])
-            time2 = datetime.fromisoformat(recent_data[1]["timestamp"])
+            time1, time2 = self._timestamps[-2], self._timestamps[-1]
             time_diff_hours = (time2 - time1).total_seconds() / 3600
             
             if time_diff_hours <= 0:
@@ -920,27 +1131,65 @@ class SnowAnalytics:
         else:
             return "Clear"
     
-    def _store_historical_data(self, analysis_result: Dict):
+    def _store_historical_data(self, analysis_result: Dict, timestamp: datetime):
         """Store analysis result in historical data."""
         self.historical_data.append(analysis_result)
+        self._timestamps.append(timestamp)
         
-        # Keep only recent data
-        if len(self.historical_data) > self.max_history:
-            self.historical_data = self.historical_data[-self.max_history:]
-        
-        # Save to file periodically
-        if len(self.historical_data) % 10 == 0:
+        # Append to the JSONL log in batches
+        self._history_buffer.append(
+            orjson.dumps(analysis_result, option=_HISTORY_JSON_OPTIONS)
+        )
+        if len(self._history_buffer) >= self._history_flush_every:
             self._save_historical_data()
     
     def _save_historical_data(self):
-        """Save historical data to file."""
+        """Append buffered measurements to the historical data log."""
+        if not self._history_buffer:
+            return
         try:
-            data_file = self.analytics_dir / "historical_data.json"
-            with open(data_file, 'w') as f:
-                json.dump(self.historical_data, f, indent=2)
+            with open(self._history_file, 'ab') as f:
+                f.writelines(self._history_buffer)
+            self._history_buffer.clear()
         except Exception as e:
             logger.warning("Failed to save historical data", error=str(e))
     
+    def _load_historical_data(self):
+        """Load the most recent measurements from the historical data log."""
+        if not self._history_file.exists():
+            return
+        try:
+            with open(self._history_file, 'rb') as f:
+                line_count = 0
+                tail = deque(maxlen=self.max_history)
+                for line in f:
+                    line_count += 1
+                    tail.append(line)
+            
+            self.historical_data.extend(orjson.loads(line) for line in tail if line.strip())
+            self._timestamps.extend(
+                datetime.fromisoformat(record["timestamp"]) for record in self.historical_data
+            )
+            
+            # Compact the log so it does not grow without bound across restarts
+            if line_count > self.max_history:
+                with open(self._history_file, 'wb') as f:
+                    f.writelines(tail)
+            
+            logger.info("Historical data loaded", data_points=len(self.historical_data))
+        except Exception as e:
+            logger.warning("Failed to load historical data", error=str(e))
+            self.historical_data.clear()
+            self._timestamps.clear()
+    
+    async def close(self):
+        """Flush pending history and release analysis resources."""
+        self._save_historical_data()
+        await self.weather_client.close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
     def get_analytics_summary(self) -> Dict:
         """Get summary of current analytics data."""
         if not self.historical_data:
@@ -952,5 +1201,6 @@ class SnowAnalytics:
             "status": "active",
             "latest_analysis": latest,
             "data_points": len(self.historical_data),
+            "fast_paths": self._fast_paths,
             "last_updated": latest["timestamp"]
         }
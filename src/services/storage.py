@@ -6,15 +6,26 @@ Handles file storage, cleanup, and storage monitoring.
 
 import asyncio
 import logging
+import os
 import shutil
+import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import aiofiles
 import structlog
+from sortedcontainers import SortedKeyList
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of unlinks in flight at once during cleanup
+_UNLINK_BATCH_SIZE = 64
+
+# Minimum seconds between the disk measurements enforce_storage_limits makes
+_LIMIT_CHECK_INTERVAL = 300
+
 
 class StorageManager:
     """Manages file storage and cleanup operations."""
@@ -33,7 +44,109 @@ class StorageManager:
         self.images_dir.mkdir(parents=True, exist_ok=True)
         self.sequences_dir.mkdir(parents=True, exist_ok=True)
         
-        logger.info("Storage manager initialized", max_storage_mb=max_storage_mb)
+        # In-memory index of saved images as (mtime, path, size, inode), ordered
+        # by mtime, so queries bisect instead of re-scanning the directory
+        self._index = SortedKeyList(key=itemgetter(0))
+        self._index_by_path: Dict[Path, Tuple[float, Path, int, int]] = {}
+        self._reconcile_index(self._scan_images()[1], set())
+        
+        # Monotonic time enforce_storage_limits last measured the disk
+        self._last_limit_check: Optional[float] = None
+        
+        logger.info("Storage manager initialized", max_storage_mb=max_storage_mb,
+                   indexed_images=len(self._index))
+    
+    @staticmethod
+    def _iter_files(directory: Path, suffix: str):
+        """
+        Yield directory entries for regular files with the given suffix.
+        
+        os.scandir exposes the file type from readdir and caches stat()
+        results on the entry, so each file costs at most one stat syscall.
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    yield entry
+    
+    @classmethod
+    def _scan_dir(cls, directory: Path, suffix: str) -> Tuple[int, int]:
+        """
+        Total a directory tree in a single scandir pass.
+        
+        Returns:
+            Tuple of (total size in bytes, count of top-level files with suffix)
+        """
+        total = 0
+        count = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += cls._scan_dir(Path(entry.path), suffix)[0]
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                    if entry.name.endswith(suffix):
+                        count += 1
+        return total, count
+    
+    def _scan_images(self) -> Tuple[int, Dict[Path, Tuple[float, int, int]]]:
+        """
+        Walk the images directory in a single scandir pass.
+        
+        Touches no shared state, so it can run in a worker thread.
+        
+        Returns:
+            Tuple of (total size in bytes of everything under the images
+            directory, {path: (mtime, size, inode)} for the top-level .jpg images)
+        """
+        total = 0
+        found = {}
+        with os.scandir(self.images_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += self._scan_dir(Path(entry.path), ".jpg")[0]
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    total += st.st_size
+                    if entry.name.endswith(".jpg"):
+                        found[Path(entry.path)] = (st.st_mtime, st.st_size, entry.inode())
+        return total, found
+    
+    def _scan_storage(self) -> Tuple[Tuple[int, Dict[Path, Tuple[float, int, int]]], Tuple[int, int]]:
+        """
+        Scan the images and sequences directories in one worker-thread call.
+        
+        Returns:
+            Tuple of (_scan_images result, (sequences size in bytes, GIF count))
+        """
+        return self._scan_images(), self._scan_dir(self.sequences_dir, ".gif")
+    
+    def _reconcile_index(self, found: Dict[Path, Tuple[float, int, int]], indexed_before: set):
+        """
+        Apply the difference between the index and a directory scan.
+        
+        Picks up files added, replaced or removed outside this process. Only
+        paths that were already indexed when the scan started are removed, so
+        an image saved while the scan ran is not dropped.
+        """
+        for file_path in indexed_before.difference(found):
+            self._index_remove(file_path)
+        for file_path, (mtime, size, inode) in found.items():
+            if self._index_by_path.get(file_path) != (mtime, file_path, size, inode):
+                self._index_add(file_path, mtime, size, inode)
+    
+    def _index_add(self, file_path: Path, mtime: float, size: int, inode: int):
+        """Add (or replace) an image in the index."""
+        self._index_remove(file_path)
+        record = (mtime, file_path, size, inode)
+        self._index.add(record)
+        self._index_by_path[file_path] = record
+    
+    def _index_remove(self, file_path: Path):
+        """Drop an image from the index if present."""
+        record = self._index_by_path.pop(file_path, None)
+        if record is not None:
+            self._index.remove(record)
     
     async def save_image(
         self,
@@ -58,8 +171,11 @@ class StorageManager:
             file_path = self.images_dir / filename
             
             # Save image
-            with open(file_path, 'wb') as f:
-                f.write(image_data)
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(image_data)
+            
+            st = file_path.stat()
+            self._index_add(file_path, st.st_mtime, len(image_data), st.st_ino)
             
             logger.info("Image saved", path=str(file_path), size_bytes=len(image_data))
             return file_path
@@ -68,6 +184,54 @@ class StorageManager:
             logger.error("Failed to save image", error=str(e))
             raise
     
+    async def load_images(
+        self,
+        images: List[Tuple[Path, datetime]]
+    ) -> List[Tuple[bytes, datetime]]:
+        """
+        Read image files, e.g. those returned by get_recent_images.
+        
+        Files are read in inode order (a cheap proxy for on-disk layout, keeping
+        readahead effective) using the inode numbers kept in the index, so no
+        extra stat calls are needed.
+        
+        Args:
+            images: List of (file_path, timestamp) tuples
+            
+        Returns:
+            List of (image_bytes, timestamp) tuples for the files that could be
+            read, in input order
+        """
+        def inode_of(i: int) -> int:
+            record = self._index_by_path.get(images[i][0])
+            return record[3] if record is not None else 0
+        
+        read_order = sorted(range(len(images)), key=inode_of)
+        contents = await asyncio.to_thread(self._read_files, [images[i][0] for i in read_order])
+        
+        loaded = [None] * len(images)
+        for i, data in zip(read_order, contents):
+            file_path, timestamp = images[i]
+            if isinstance(data, Exception):
+                logger.warning("Failed to load image", path=str(file_path), error=str(data))
+                if isinstance(data, FileNotFoundError):
+                    # Removed behind our back; stop offering it
+                    self._index_remove(file_path)
+            else:
+                loaded[i] = (data, timestamp)
+        return [item for item in loaded if item is not None]
+    
+    @staticmethod
+    def _read_files(paths: List[Path]) -> List[Union[bytes, Exception]]:
+        """Read files in the given order; runs in an executor thread."""
+        results = []
+        for path in paths:
+            try:
+                results.append(path.read_bytes())
+            except OSError as e:
+                results.append(e)
+        return results
+    
     def get_image_path(self, timestamp: datetime, prefix: str = "snapshot") -> Optional[Path]:
         """
         Get the path for an image with the given timestamp.
@@ -107,20 +271,19 @@ class StorageManager:
             List of (file_path, timestamp) tuples
         """
         try:
-            cutoff_time = datetime.now() - timedelta(minutes=minutes)
+            cutoff_ts = (datetime.now() - timedelta(minutes=minutes)).timestamp()
             images = []
             
-            for file_path in self.images_dir.glob("*.jpg"):
-                if file_path.stat().st_mtime >= cutoff_time.timestamp():
-                    # Extract timestamp from filename
-                    try:
-                        timestamp_str = file_path.stem.split('_', 1)[1]
-                        timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                        images.append((file_path, timestamp))
-                    except (ValueError, IndexError):
-                        # Fallback to file modification time
-                        timestamp = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        images.append((file_path, timestamp))
+            for mtime, file_path, _, _ in self._index.irange_key(min_key=cutoff_ts):
+                # Extract timestamp from filename
+                try:
+                    timestamp_str = file_path.stem.split('_', 1)[1]
+                    timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
+                    images.append((file_path, timestamp))
+                except (ValueError, IndexError):
+                    # Fallback to file modification time
+                    timestamp = datetime.fromtimestamp(mtime)
+                    images.append((file_path, timestamp))
             
             # Sort by timestamp (oldest first) and limit
             images.sort(key=lambda x: x[1], reverse=False)
@@ -147,21 +310,24 @@ class StorageManager:
             Tuple of (images_deleted, sequences_deleted)
         """
         try:
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-            images_deleted = 0
-            sequences_deleted = 0
+            cutoff_ts = (datetime.now() - timedelta(hours=max_age_hours)).timestamp()
             
             # Clean up old images
-            for file_path in self.images_dir.glob("*.jpg"):
-                if file_path.stat().st_mtime < cutoff_time.timestamp():
-                    file_path.unlink()
-                    images_deleted += 1
+            expired = [
+                file_path for _, file_path, _, _ in
+                self._index.irange_key(max_key=cutoff_ts, inclusive=(True, False))
+            ]
+            deleted_images = await self._unlink_files(expired)
+            for file_path in deleted_images:
+                self._index_remove(file_path)
+            images_deleted = len(deleted_images)
             
             # Clean up old sequences
-            for file_path in self.sequences_dir.glob("*.gif"):
-                if file_path.stat().st_mtime < cutoff_time.timestamp():
-                    file_path.unlink()
-                    sequences_deleted += 1
+            old_sequences = [
+                Path(entry.path) for entry in self._iter_files(self.sequences_dir, ".gif")
+                if entry.stat().st_mtime < cutoff_ts
+            ]
+            sequences_deleted = len(await self._unlink_files(old_sequences))
             
             logger.info(
                 "File cleanup completed",
@@ -175,6 +341,32 @@ class StorageManager:
             logger.error("Failed to cleanup old files", error=str(e))
             return 0, 0
     
+    @staticmethod
+    async def _unlink_files(paths: List[Path]) -> List[Path]:
+        """
+        Delete files concurrently in the default executor.
+        
+        Args:
+            paths: Files to delete; ones already gone are skipped
+            
+        Returns:
+            The paths actually deleted
+        """
+        loop = asyncio.get_running_loop()
+        deleted = []
+        for start in range(0, len(paths), _UNLINK_BATCH_SIZE):
+            batch = paths[start:start + _UNLINK_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, path.unlink) for path in batch),
+                return_exceptions=True
+            )
+            for path, result in zip(batch, results):
+                if result is None:
+                    deleted.append(path)
+                elif not isinstance(result, FileNotFoundError):
+                    logger.warning("Failed to delete file", path=str(path), error=str(result))
+        return deleted
+    
     async def get_storage_usage(self) -> dict:
         """
         Get current storage usage statistics.
@@ -183,22 +375,16 @@ class StorageManager:
             Dictionary with storage statistics
         """
         try:
-            def get_dir_size(path: Path) -> int:
-                """Calculate directory size in bytes."""
-                total = 0
-                for file_path in path.rglob("*"):
-                    if file_path.is_file():
-                        total += file_path.stat().st_size
-                return total
-            
-            images_size = get_dir_size(self.images_dir)
-            sequences_size = get_dir_size(self.sequences_dir)
+            # Measure both directories off the event loop, then bring the
+            # index in line with what is on disk
+            indexed_before = set(self._index_by_path)
+            (images_size, found), (sequences_size, sequence_count) = await asyncio.to_thread(
+                self._scan_storage
+            )
+            self._reconcile_index(found, indexed_before)
+            image_count = len(found)
             total_size = images_size + sequences_size
             
-            # Count files
-            image_count = len(list(self.images_dir.glob("*.jpg")))
-            sequence_count = len(list(self.sequences_dir.glob("*.gif")))
-            
             usage = {
                 "images_size_mb": round(images_size / (1024 * 1024), 2),
                 "sequences_size_mb": round(sequences_size / (1024 * 1024), 2),
@@ -220,10 +406,18 @@ class StorageManager:
         """
         Enforce storage limits by cleaning up old files.
         
+        Called after every capture, but measures the disk at most once per
+        _LIMIT_CHECK_INTERVAL seconds.
+        
         Returns:
             True if cleanup was performed
         """
         try:
+            now = time.monotonic()
+            if self._last_limit_check is not None and now - self._last_limit_check < _LIMIT_CHECK_INTERVAL:
+                return False
+            self._last_limit_check = now
+            
             usage = await self.get_storage_usage()
             
             if usage.get("usage_percent", 0) > 90:  # Cleanup at 90% usage
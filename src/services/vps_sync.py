@@ -5,14 +5,220 @@ Handles RSYNC synchronization of generated GIFs to public-facing VPS server.
 """
 
 import asyncio
-import subprocess
+import hashlib
+import html
+import json
+import shlex
+import shutil
+import stat
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional
+import asyncssh
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Share one SSH connection between rsync and the follow-up remote commands
+# instead of paying a full handshake for each of them
+_SSH_CONTROL_PATH = '/tmp/imgsrv-%C'
+_SSH_CONTROL_PERSIST = '10m'
+
+# Seconds of rsync I/O inactivity before giving up
+_RSYNC_IO_TIMEOUT = 15
+
+# How long a cached SSH key existence check stays valid, in seconds
+_KEY_CHECK_TTL = 60
+
+# Upper bound, in seconds, on flushing a pending sync while shutting down
+_CLOSE_FLUSH_TIMEOUT = 60
+
+# Landing page shipped to the VPS with each sync; @GIF@ marks where the newest
+# sequence filename goes
+_INDEX_HTML_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+    <title>Woodland Hills City Center - Snow Load Monitoring</title>
+    <meta http-equiv="refresh" content="300">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 0;
+            padding: 10px;
+            background-color: #f0f0f0;
+        }
+        .container {
+            max-width: 100%;
+            margin: 0 auto;
+            background-color: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background-color: #2c3e50;
+            color: white;
+            padding: 15px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 1.5em;
+        }
+        .header h2 {
+            margin: 5px 0 0 0;
+            font-size: 1em;
+            opacity: 0.9;
+        }
+        .content {
+            padding: 15px;
+            text-align: center;
+        }
+        .camera-image {
+            max-width: 100%;
+            height: auto;
+            border-radius: 4px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        .info {
+            margin-top: 15px;
+            color: #666;
+            font-size: 14px;
+        }
+        .refresh-info {
+            font-size: 12px;
+            color: #888;
+            margin-top: 10px;
+        }
+        
+        /* Mobile optimizations */
+        @media (max-width: 768px) {
+            body {
+                padding: 5px;
+            }
+            .header {
+                padding: 10px;
+            }
+            .header h1 {
+                font-size: 1.3em;
+            }
+            .header h2 {
+                font-size: 0.9em;
+            }
+            .content {
+                padding: 10px;
+            }
+            .info {
+                font-size: 12px;
+            }
+            .refresh-info {
+                font-size: 10px;
+            }
+        }
+        
+        /* Very small screens */
+        @media (max-width: 480px) {
+            .header h1 {
+                font-size: 1.1em;
+            }
+            .header h2 {
+                font-size: 0.8em;
+            }
+            .content {
+                padding: 8px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Woodland Hills City Center</h1>
+            <h2>Snow Load Monitoring</h2>
+        </div>
+        <div class="content">
+            <img src="@GIF@" alt="Snow Load Monitoring GIF" class="camera-image">
+            <div class="info">
+                <p>GIF updates every 5 minutes</p>
+                <div class="refresh-info">
+                    Page refreshes automatically every 5 minutes
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>'''
+
+_INDEX_HTML_PREFIX, _INDEX_HTML_SUFFIX = (
+    part.encode('utf-8') for part in _INDEX_HTML_TEMPLATE.split('@GIF@')
+)
+
+# Web server users to try for ownership, in order of preference
+_WEB_USERS = ('www-data', 'nginx', 'apache', 'httpd')
+
+# Remote post-sync script (after the REMOTE= and CANDIDATES= lines): fixes
+# ownership/permissions using the first candidate user that works
+_POST_SYNC_SCRIPT_BODY = '''WEB_USER=""
+for u in $CANDIDATES; do
+    if id "$u" >/dev/null 2>&1 && chown -R "$u:$u" "$REMOTE" 2>/dev/null; then
+        WEB_USER=$u
+        break
+    fi
+done
+echo "WEB_USER:$WEB_USER"
+chmod -R 755 "$REMOTE" || echo "CHMOD_FAILED"
+'''
+
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Resolve a command name to an absolute path (falls back to the name)."""
+    return shutil.which(name) or name
+
+
+async def _spawn(program: str, *args, **kwargs) -> asyncio.subprocess.Process:
+    """
+    Start a subprocess in a way that lets CPython use posix_spawn.
+    
+    The posix_spawn fast path needs an absolute executable path and
+    close_fds=False (our descriptors are non-inheritable by default anyway),
+    which avoids duplicating the parent's address space for every ssh/rsync.
+    """
+    return await asyncio.create_subprocess_exec(
+        _resolve_executable(program), *args, close_fds=False, **kwargs
+    )
+
+
+def write_index_html(local_path: Path, latest_gif_name: str) -> bool:
+    """
+    Write index.html pointing at the newest GIF into the directory to be synced.
+    
+    Args:
+        local_path: Local sync directory
+        latest_gif_name: Filename of the newest sequence GIF
+        
+    Returns:
+        True if the file was (re)written, False if it was already up to date
+    """
+    rendered = _INDEX_HTML_PREFIX + html.escape(latest_gif_name).encode('utf-8') + _INDEX_HTML_SUFFIX
+    index_path = Path(local_path) / 'index.html'
+    try:
+        if index_path.read_bytes() == rendered:
+            return False
+    except FileNotFoundError:
+        pass
+    index_path.write_bytes(rendered)
+    return True
+
+
+class _RemoteResult(NamedTuple):
+    """Exit status and combined stdout/stderr of a remote command."""
+    exit_status: int
+    output: str
+
 
 class VPSSyncError(Exception):
     """VPS synchronization errors."""
@@ -26,6 +232,53 @@ class VPSSynchronizer:
         self.settings = settings
         self.enabled = settings.vps_enabled
         
+        # Persistent SSH connection for remote commands (opened on first use)
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._conn_lock = asyncio.Lock()
+        # Long-lived remote shell that commands are written to (see _run_remote)
+        self._shell: Optional[asyncssh.SSHClientProcess] = None
+        self._shell_lock = asyncio.Lock()
+        
+        # Content hashes of files as of the last successful sync
+        self._hash_cache_path = Path(settings.data_dir) / "sync_hashes.json"
+        self._synced_hashes: Optional[Dict[str, str]] = self._load_sync_hashes()
+        # Monotonic time of the last successful full (non file-list) sync;
+        # None forces the next sync to be a full one
+        self._last_full_sync: Optional[float] = None
+        
+        # Command pieces derived from settings, built once
+        self._rsync_options = settings.vps_rsync_options.split()
+        if settings.vps_compress:
+            self._rsync_options += ['-z', '--compress-choice=zstd']
+        # An explicit file list replaces recursion, so deletions are
+        # expressed as missing args instead of --delete. The hash cache
+        # already picked the files, so --checksum (which reads every listed
+        # file in full on both ends) is opt-in.
+        self._rsync_file_list_options = [
+            *(opt for opt in self._rsync_options if opt != '--delete'),
+            '--files-from=-', '--delete-missing-args'
+        ]
+        if settings.vps_rsync_checksum:
+            self._rsync_file_list_options.append('--checksum')
+        if settings.vps_rsync_checksum_choice:
+            self._rsync_file_list_options.append(
+                f'--checksum-choice={settings.vps_rsync_checksum_choice}'
+            )
+        self._rsync_ssh = shlex.join(self._ssh_base_args())
+        self._ssh_target = f'{settings.vps_user}@{settings.vps_host}'
+        self._remote_target = f'{self._ssh_target}:{settings.vps_remote_path}/'
+        self._web_users = _WEB_USERS
+        self._post_sync_script = self._make_post_sync_script(self._web_users)
+        self._key_exists: Optional[bool] = None
+        # GIF the local index.html was last rendered for
+        self._index_gif: Optional[str] = None
+        self._key_checked_at = 0.0
+        
+        # Debounced background sync (see request_sync)
+        self._dirty = asyncio.Event()
+        self._pending_path: Optional[Path] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        
         if self.enabled:
             self._validate_config()
             self._setup_ssh_key()
@@ -50,16 +303,201 @@ class VPSSynchronizer:
         # Create .ssh directory if it doesn't exist
         ssh_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
         
-        # Check if SSH key exists
-        if not ssh_key_path.exists():
+        # Check the key once and only tighten permissions if needed
+        try:
+            mode = stat.S_IMODE(os.stat(ssh_key_path).st_mode)
+        except FileNotFoundError:
             logger.warning("SSH key not found", path=str(ssh_key_path))
             logger.info("Please ensure SSH key is placed at the configured path")
+            return
         
-        # Set proper permissions
-        if ssh_key_path.exists():
-            ssh_key_path.chmod(0o600)
+        if mode != 0o600:
+            os.chmod(ssh_key_path, 0o600)
             logger.info("SSH key permissions set")
     
+    def _ssh_base_args(self, control_master: str = 'auto') -> list:
+        """Build the common ssh argument list (connection multiplexing included)."""
+        return [
+            'ssh',
+            '-p', str(self.settings.vps_port),
+            '-i', self.settings.vps_ssh_key_path,
+            '-o', f'ControlMaster={control_master}',
+            '-o', f'ControlPath={_SSH_CONTROL_PATH}',
+            '-o', f'ControlPersist={_SSH_CONTROL_PERSIST}',
+            '-o', 'StrictHostKeyChecking=no',
+            '-o', 'ConnectTimeout=10',
+        ]
+    
+    async def _get_connection(self) -> asyncssh.SSHClientConnection:
+        """Return the shared SSH connection, opening it on first use."""
+        async with self._conn_lock:
+            if self._conn is None:
+                self._conn = await asyncio.wait_for(
+                    asyncssh.connect(
+                        self.settings.vps_host,
+                        port=self.settings.vps_port,
+                        username=self.settings.vps_user,
+                        client_keys=[self.settings.vps_ssh_key_path],
+                        known_hosts=None
+                    ),
+                    timeout=10
+                )
+            return self._conn
+    
+    async def _run_remote(self, command: str, timeout: float = 15) -> _RemoteResult:
+        """
+        Run a command in the persistent remote shell.
+        
+        The command runs in a subshell (so exit/cd/variables do not leak) with
+        stderr folded into stdout, followed by a marker line carrying its exit
+        status. Each command gets its own marker nonce, so output left over from
+        an earlier command can never be mistaken for this one's. If the call
+        fails for any reason (transport error, timeout or cancellation), the
+        shell and connection are dropped so the next call starts clean.
+        """
+        marker = f'__IMGSRV_DONE_{os.urandom(8).hex()}__:'
+        async with self._shell_lock:
+            try:
+                if self._shell is None:
+                    conn = await self._get_connection()
+                    self._shell = await conn.create_process('bash')
+                
+                self._shell.stdin.write(f'( {command}\n) 2>&1; echo "{marker}$?"\n')
+                output = await asyncio.wait_for(self._shell.stdout.readuntil(marker), timeout=timeout)
+                status = await asyncio.wait_for(self._shell.stdout.readline(), timeout=timeout)
+                return _RemoteResult(int(status.strip()), output[:-len(marker)])
+            except BaseException:
+                # Includes CancelledError: unread output would otherwise be
+                # left in the shell for the next command to pick up
+                self._drop_connection()
+                raise
+    
+    def _drop_connection(self):
+        """Discard the remote shell and SSH connection."""
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    async def close(self):
+        """Flush any pending sync, stop the background task and close the shared SSH connection."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+            
+            # A request still waiting out its debounce (or interrupted mid-sync)
+            # would otherwise never reach the VPS
+            if self._dirty.is_set():
+                self._dirty.clear()
+                try:
+                    await asyncio.wait_for(self.sync_to_vps(self._pending_path), timeout=_CLOSE_FLUSH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("Pending VPS sync did not finish before shutdown")
+        self._drop_connection()
+    
+    async def start(self):
+        """Open the SSH master connection that every rsync run reuses."""
+        if self.enabled:
+            await self._prime_control_master()
+    
+    async def _prime_control_master(self):
+        """Start a background SSH master connection if one is not already running."""
+        target = self._ssh_target
+        try:
+            check = await _spawn(
+                *self._ssh_base_args(), '-O', 'check', target,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            if await asyncio.wait_for(check.wait(), timeout=5) == 0:
+                return
+            
+            # -f backgrounds the master after authentication; its output is
+            # discarded so we do not wait on pipes held by the daemon
+            process = await _spawn(
+                *self._ssh_base_args(control_master='yes'), '-N', '-f', target,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            await asyncio.wait_for(process.wait(), timeout=15)
+        except asyncio.TimeoutError:
+            logger.debug("SSH master connection setup timeout")
+        except Exception as e:
+            logger.debug("SSH master connection setup failed", error=str(e))
+    
+    def _load_sync_hashes(self) -> Optional[Dict[str, str]]:
+        """Load the hash cache from the last successful sync, if any."""
+        try:
+            with open(self._hash_cache_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Failed to load sync hash cache", error=str(e))
+            return None
+    
+    def _save_sync_hashes(self):
+        """Persist the hash cache after a successful sync."""
+        try:
+            with open(self._hash_cache_path, 'w') as f:
+                json.dump(self._synced_hashes, f)
+        except Exception as e:
+            logger.warning("Failed to save sync hash cache", error=str(e))
+    
+    @staticmethod
+    def _hash_directory(local_path: Path) -> Dict[str, str]:
+        """Return {filename: sha256} for the regular files in local_path."""
+        hashes = {}
+        with os.scandir(local_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    with open(entry.path, 'rb') as f:
+                        hashes[entry.name] = hashlib.file_digest(f, 'sha256').hexdigest()
+        return hashes
+    
+    def request_sync(self, local_path: Path):
+        """
+        Schedule a sync of local_path without waiting for it.
+        
+        Requests arriving within the debounce window are coalesced into a
+        single rsync run.
+        
+        Args:
+            local_path: Local path to sync (sequences directory)
+        """
+        if not self.enabled:
+            return
+        
+        self._pending_path = local_path
+        self._dirty.set()
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+    
+    async def _sync_loop(self):
+        """Background task draining debounced sync requests."""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(self.settings.vps_sync_debounce_seconds)
+            self._dirty.clear()
+            
+            try:
+                synced = await self.sync_to_vps(self._pending_path)
+            except asyncio.CancelledError:
+                # Leave the request pending so close() can flush it
+                self._dirty.set()
+                raise
+            
+            if synced:
+                logger.info("Sequence synchronized to VPS")
+            else:
+                logger.warning("VPS synchronization failed")
+    
     async def sync_to_vps(self, local_path: Path) -> bool:
         """
         Synchronize local content to VPS server.
@@ -75,30 +513,76 @@ class VPSSynchronizer:
             return True
         
         try:
+            # Hash the directory; the listing also tells us the newest GIF
+            loop = asyncio.get_running_loop()
+            hashes = await loop.run_in_executor(None, self._hash_directory, local_path)
+            
+            # Point index.html at the newest GIF so it ships with the rsync
+            # (sequence filenames embed a sortable timestamp)
+            latest_gif = max(
+                (name for name in hashes if name.startswith('sequence_') and name.endswith('.gif')),
+                default=None
+            )
+            if not latest_gif:
+                logger.warning("No GIF files found to create index.html")
+            elif latest_gif != self._index_gif or 'index.html' not in hashes:
+                # Only touch index.html when the newest GIF changed since we
+                # last rendered it
+                if write_index_html(local_path, latest_gif) or 'index.html' not in hashes:
+                    index_bytes = (local_path / 'index.html').read_bytes()
+                    hashes['index.html'] = hashlib.sha256(index_bytes).hexdigest()
+                self._index_gif = latest_gif
+            
+            # Work out which files changed since the last successful sync. The
+            # hash cache cannot see files lost on the VPS, so a full sync runs
+            # periodically and after any failure to repair them.
+            full_sync_due = (
+                self._last_full_sync is None
+                or time.monotonic() - self._last_full_sync >= self.settings.vps_full_sync_interval_seconds
+            )
+            changed_files = None
+            if self._synced_hashes is not None and not full_sync_due:
+                changed_files = [
+                    name for name, digest in hashes.items()
+                    if self._synced_hashes.get(name) != digest
+                ]
+                # Removed files are listed too so rsync deletes them remotely
+                changed_files += [name for name in self._synced_hashes if name not in hashes]
+                if not changed_files:
+                    logger.debug("VPS content unchanged, skipping sync")
+                    return True
+            
             # Build RSYNC command
-            cmd = self._build_rsync_command(local_path)
+            cmd = self._build_rsync_command(local_path, changed_files)
             
             logger.info("Starting VPS synchronization", 
                        local_path=str(local_path),
-                       remote_path=self.settings.vps_remote_path)
+                       remote_path=self.settings.vps_remote_path,
+                       changed_files=len(changed_files) if changed_files is not None else "all")
             
             # Run RSYNC command
-            process = await asyncio.create_subprocess_exec(
+            process = await _spawn(
                 *cmd,
-                stdout=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.PIPE,
+                # rsync -v output is never inspected; only stderr matters
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+            file_list = '\n'.join(changed_files or []).encode('utf-8')
+            _, stderr = await asyncio.wait_for(process.communicate(input=file_list), timeout=60)
             
             if process.returncode == 0:
                 logger.info("VPS synchronization completed successfully")
+                if changed_files is None:
+                    self._last_full_sync = time.monotonic()
                 
-                # Fix permissions on VPS after sync
-                await self._fix_vps_permissions()
-                
-                # Ensure index.html exists on VPS
-                await self._ensure_index_html()
+                # Persist the hash cache locally while permissions are fixed
+                # on the VPS; both handle their own errors
+                self._synced_hashes = hashes
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(asyncio.to_thread(self._save_sync_hashes))
+                    tg.create_task(self._run_post_sync())
                 
                 return True
             else:
@@ -106,277 +590,81 @@ class VPSSynchronizer:
                 logger.error("VPS synchronization failed", 
                            returncode=process.returncode,
                            error=error_msg)
+                self._last_full_sync = None
                 return False
                 
         except asyncio.TimeoutError:
             logger.error("VPS synchronization timeout")
+            self._last_full_sync = None
             return False
         except Exception as e:
             logger.error("VPS synchronization error", error=str(e))
+            self._last_full_sync = None
             return False
     
-    def _build_rsync_command(self, local_path: Path) -> list:
-        """Build RSYNC command with proper options."""
+    def _build_rsync_command(self, local_path: Path, changed_files: Optional[List[str]] = None) -> list:
+        """
+        Build RSYNC command with proper options.
+        
+        Args:
+            local_path: Local directory to sync
+            changed_files: Names to transfer (read from stdin); None syncs the
+                whole directory
+        """
+        options = self._rsync_options if changed_files is None else self._rsync_file_list_options
+        
         cmd = [
             'rsync',
-            *self.settings.vps_rsync_options.split(),
-            '-e', f'ssh -p {self.settings.vps_port} -i {self.settings.vps_ssh_key_path} -o StrictHostKeyChecking=no',
+            *options,
+            # The SSH transport is already up via the control master, so a
+            # stalled transfer is detected quickly instead of after the full timeout
+            f'--timeout={_RSYNC_IO_TIMEOUT}',
+            '-e', self._rsync_ssh,
             f'{local_path}/',
-            f'{self.settings.vps_user}@{self.settings.vps_host}:{self.settings.vps_remote_path}/'
+            self._remote_target
         ]
         
-        logger.debug("RSYNC command built", cmd=' '.join(cmd))
+        # Log the argument list as-is; nothing is formatted unless the event is rendered
+        logger.debug("RSYNC command built", cmd=cmd)
         return cmd
     
-    async def _fix_vps_permissions(self):
-        """Fix file permissions on VPS after sync."""
-        try:
-            # Try multiple web server users in order of preference
-            web_users = ['www-data', 'nginx', 'apache', 'httpd']
-            
-            for web_user in web_users:
-                cmd = [
-                    'ssh',
-                    '-p', str(self.settings.vps_port),
-                    '-i', self.settings.vps_ssh_key_path,
-                    '-o', 'StrictHostKeyChecking=no',
-                    '-o', 'ConnectTimeout=10',
-                    f'{self.settings.vps_user}@{self.settings.vps_host}',
-                    f'id {web_user} >/dev/null 2>&1 && chown -R {web_user}:{web_user} {self.settings.vps_remote_path} && chmod -R 755 {self.settings.vps_remote_path} && echo "SUCCESS:{web_user}" || echo "FAILED:{web_user}"'
-                ]
-                
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=15)
-                
-                if process.returncode == 0:
-                    output = stdout.decode('utf-8').strip()
-                    if 'SUCCESS:' in output:
-                        web_user_used = output.split('SUCCESS:')[1]
-                        logger.info("VPS permissions fixed successfully", web_user=web_user_used)
-                        return
-                    else:
-                        logger.debug(f"Web user {web_user} not found, trying next")
-                        continue
-                else:
-                    error_msg = stderr.decode('utf-8') if stderr else "Unknown permission error"
-                    logger.debug(f"Failed to fix permissions with {web_user}", error=error_msg)
-                    continue
-            
-            # If all web users failed, try generic approach
-            logger.warning("All web user attempts failed, trying generic permission fix")
-            cmd = [
-                'ssh',
-                '-p', str(self.settings.vps_port),
-                '-i', self.settings.vps_ssh_key_path,
-                '-o', 'StrictHostKeyChecking=no',
-                '-o', 'ConnectTimeout=10',
-                f'{self.settings.vps_user}@{self.settings.vps_host}',
-                f'chmod -R 755 {self.settings.vps_remote_path} && ls -la {self.settings.vps_remote_path}'
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=15)
-            
-            if process.returncode == 0:
-                logger.info("VPS permissions fixed with generic approach")
-                logger.debug("VPS directory listing", output=stdout.decode('utf-8'))
-            else:
-                error_msg = stderr.decode('utf-8') if stderr else "Unknown permission error"
-                logger.error("All VPS permission fix attempts failed", error=error_msg)
-                
-        except asyncio.TimeoutError:
-            logger.warning("VPS permission fix timeout")
-        except Exception as e:
-            logger.warning("VPS permission fix error", error=str(e))
+    def _make_post_sync_script(self, web_users) -> str:
+        """Build the remote permission-fix script for the given candidate users."""
+        return (
+            f"REMOTE={shlex.quote(self.settings.vps_remote_path)}\n"
+            f"CANDIDATES={shlex.quote(' '.join(web_users))}\n"
+            + _POST_SYNC_SCRIPT_BODY
+        )
     
-    async def _ensure_index_html(self):
-        """Ensure index.html exists on VPS with latest GIF."""
+    async def _run_post_sync(self):
+        """Fix VPS permissions in one SSH session."""
         try:
-            # Get the latest GIF filename
-            cmd = [
-                'ssh',
-                '-p', str(self.settings.vps_port),
-                '-i', self.settings.vps_ssh_key_path,
-                '-o', 'StrictHostKeyChecking=no',
-                '-o', 'ConnectTimeout=10',
-                f'{self.settings.vps_user}@{self.settings.vps_host}',
-                f'ls -t {self.settings.vps_remote_path}/sequence_*.gif 2>/dev/null | head -1 | xargs basename 2>/dev/null || echo "no_gif"'
-            ]
+            result = await self._run_remote(self._post_sync_script, timeout=30)
             
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            if result.exit_status != 0:
+                logger.warning("VPS post-sync step failed", error=result.output or "Unknown remote error")
+                return
             
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=15)
+            output = result.output
+            status = dict(line.split(':', 1) for line in output.splitlines() if ':' in line)
             
-            if process.returncode == 0:
-                latest_gif = stdout.decode('utf-8').strip()
-                
-                if latest_gif != "no_gif":
-                    # Create index.html with the latest GIF
-                    html_content = f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>Woodland Hills City Center - Snow Load Monitoring</title>
-    <meta http-equiv="refresh" content="300">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 10px;
-            background-color: #f0f0f0;
-        }}
-        .container {{
-            max-width: 100%;
-            margin: 0 auto;
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background-color: #2c3e50;
-            color: white;
-            padding: 15px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 1.5em;
-        }}
-        .header h2 {{
-            margin: 5px 0 0 0;
-            font-size: 1em;
-            opacity: 0.9;
-        }}
-        .content {{
-            padding: 15px;
-            text-align: center;
-        }}
-        .camera-image {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 4px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .info {{
-            margin-top: 15px;
-            color: #666;
-            font-size: 14px;
-        }}
-        .refresh-info {{
-            font-size: 12px;
-            color: #888;
-            margin-top: 10px;
-        }}
-        
-        /* Mobile optimizations */
-        @media (max-width: 768px) {{
-            body {{
-                padding: 5px;
-            }}
-            .header {{
-                padding: 10px;
-            }}
-            .header h1 {{
-                font-size: 1.3em;
-            }}
-            .header h2 {{
-                font-size: 0.9em;
-            }}
-            .content {{
-                padding: 10px;
-            }}
-            .info {{
-                font-size: 12px;
-            }}
-            .refresh-info {{
-                font-size: 10px;
-            }}
-        }}
-        
-        /* Very small screens */
-        @media (max-width: 480px) {{
-            .header h1 {{
-                font-size: 1.1em;
-            }}
-            .header h2 {{
-                font-size: 0.8em;
-            }}
-            .content {{
-                padding: 8px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Woodland Hills City Center</h1>
-            <h2>Snow Load Monitoring</h2>
-        </div>
-        <div class="content">
-            <img src="{latest_gif}" alt="Snow Load Monitoring GIF" class="camera-image">
-            <div class="info">
-                <p>GIF updates every 5 minutes</p>
-                <div class="refresh-info">
-                    Page refreshes automatically every 5 minutes
-                </div>
-            </div>
-        </div>
-    </div>
-</body>
-</html>'''
-                    
-                    # Write index.html to VPS
-                    cmd = [
-                        'ssh',
-                        '-p', str(self.settings.vps_port),
-                        '-i', self.settings.vps_ssh_key_path,
-                        '-o', 'StrictHostKeyChecking=no',
-                        '-o', 'ConnectTimeout=10',
-                        f'{self.settings.vps_user}@{self.settings.vps_host}',
-                        f'cat > {self.settings.vps_remote_path}/index.html'
-                    ]
-                    
-                    process = await asyncio.create_subprocess_exec(
-                        *cmd,
-                        stdin=asyncio.subprocess.PIPE,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    
-                    stdout, stderr = await asyncio.wait_for(
-                        process.communicate(input=html_content.encode('utf-8')), 
-                        timeout=15
-                    )
-                    
-                    if process.returncode == 0:
-                        logger.info("index.html updated on VPS", gif_file=latest_gif)
-                    else:
-                        logger.warning("Failed to update index.html on VPS")
-                else:
-                    logger.warning("No GIF files found on VPS to create index.html")
+            web_user = status.get('WEB_USER')
+            if web_user:
+                logger.info("VPS permissions fixed successfully", web_user=web_user)
+                # Later syncs go straight to the user that worked (falling back
+                # to the full list if it ever stops working)
+                if web_user in _WEB_USERS and web_user != self._web_users[0]:
+                    self._web_users = (web_user, *(u for u in _WEB_USERS if u != web_user))
+                    self._post_sync_script = self._make_post_sync_script(self._web_users)
             else:
-                logger.warning("Failed to get latest GIF filename from VPS")
+                logger.warning("No web server user found, applied generic permission fix")
+            if 'CHMOD_FAILED' in output:
+                logger.error("VPS permission fix failed")
                 
         except asyncio.TimeoutError:
-            logger.warning("index.html update timeout")
+            logger.warning("VPS post-sync step timeout")
         except Exception as e:
-            logger.warning("index.html update error", error=str(e))
+            logger.warning("VPS post-sync step error", error=str(e))
     
     async def test_connection(self) -> bool:
         """Test VPS connection."""
@@ -384,30 +672,13 @@ class VPSSynchronizer:
             return True
         
         try:
-            cmd = [
-                'ssh',
-                '-p', str(self.settings.vps_port),
-                '-i', self.settings.vps_ssh_key_path,
-                '-o', 'StrictHostKeyChecking=no',
-                '-o', 'ConnectTimeout=10',
-                f'{self.settings.vps_user}@{self.settings.vps_host}',
-                'echo "VPS connection test successful"'
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=15)
+            result = await self._run_remote('echo "VPS connection test successful"')
             
-            if process.returncode == 0:
+            if result.exit_status == 0:
                 logger.info("VPS connection test successful")
                 return True
             else:
-                error_msg = stderr.decode('utf-8') if stderr else "Unknown SSH error"
-                logger.warning("VPS connection test failed", error=error_msg)
+                logger.warning("VPS connection test failed", error=result.output or "Unknown SSH error")
                 return False
                 
         except asyncio.TimeoutError:
@@ -424,5 +695,13 @@ class VPSSynchronizer:
             "host": self.settings.vps_host if self.enabled else None,
             "user": self.settings.vps_user if self.enabled else None,
             "remote_path": self.settings.vps_remote_path if self.enabled else None,
-            "ssh_key_exists": Path(self.settings.vps_ssh_key_path).exists() if self.enabled else None
+            "ssh_key_exists": self._ssh_key_exists() if self.enabled else None
         }
+    
+    def _ssh_key_exists(self) -> bool:
+        """Check for the SSH key, re-stat'ing at most once per _KEY_CHECK_TTL seconds."""
+        now = time.monotonic()
+        if self._key_exists is None or now - self._key_checked_at > _KEY_CHECK_TTL:
+            self._key_exists = Path(self.settings.vps_ssh_key_path).exists()
+            self._key_checked_at = now
+        return self._key_exists
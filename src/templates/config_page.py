@@ -5,274 +5,106 @@ Provides a web-based interface for configuring analytics settings,
 location, and overlay preferences.
 """
 
-from datetime import datetime
-from typing import Dict, Any
+import gzip
+import hashlib
+import html
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 
-import structlog
-from fastapi import Request
-from fastapi.responses import HTMLResponse
+# (value, label) pairs offered by the select controls
+_UPDATE_INTERVAL_OPTIONS = (
+    (1, "1 minute"), (5, "5 minutes"), (10, "10 minutes"), (15, "15 minutes"), (30, "30 minutes")
+)
+_SEQUENCE_INTERVAL_OPTIONS = (
+    (1, "1 minute"), (2, "2 minutes"), (5, "5 minutes"),
+    (10, "10 minutes"), (15, "15 minutes"), (30, "30 minutes")
+)
+_OVERLAY_STYLE_OPTIONS = (
+    ("full", "Full Analytics Panel"),
+    ("minimal", "Minimal Timestamp"),
+    ("mobile", "Mobile Optimized"),
+    ("none", "No Overlay"),
+)
+_GIF_OPTIMIZATION_OPTIONS = (
+    ("low", "Low (256 colors, larger file)"),
+    ("balanced", "Balanced (192 colors, good quality)"),
+    ("aggressive", "Aggressive (128 colors, smallest file)"),
+)
+# Joins <option> lines at the indentation of their placeholder in the template
+_OPTION_SEPARATOR = "\n" + " " * 28
 
-logger = structlog.get_logger(__name__)
+_STATIC_DIR = Path(__file__).parent / "static"
 
 
-def create_config_page_html(config_data: Dict[str, Any]) -> str:
-    """Create the analytics configuration page HTML."""
-    
-    # Extract current values
-    analytics_enabled = config_data.get("analytics_enabled", True)
-    weather_latitude = config_data.get("weather_latitude", 40.0)
-    weather_longitude = config_data.get("weather_longitude", -111.8)
-    location_name = config_data.get("weather_location_name", "Woodland Hills, Utah")
-    overlay_style = config_data.get("analytics_overlay_style", "minimal")
-    overlay_enabled = config_data.get("analytics_overlay_enabled", True)
-    update_interval = config_data.get("analytics_update_interval_minutes", 5)
-    snow_threshold = config_data.get("snow_detection_threshold", 0.7)
-    ice_temp = config_data.get("ice_warning_temperature", 32)
-    hazardous_depth = config_data.get("hazardous_snow_depth", 2.0)
-    sequence_update_interval = config_data.get("sequence_update_interval_minutes", 5)
-    max_images = config_data.get("max_images_per_sequence", 10)
-    gif_frame_duration = config_data.get("gif_frame_duration_seconds", 1.0)
-    gif_optimization = config_data.get("gif_optimization_level", "balanced")
-    
-    # Calculate capture interval for display
-    capture_interval = (sequence_update_interval * 60) / max_images if max_images > 0 else 30
-    
-    html = f"""
+class _Asset(NamedTuple):
+    """A static page asset held in memory, raw and gzip-compressed."""
+    content: bytes
+    gzipped: bytes
+    media_type: str
+    # Content hash in the asset URL lets it be cached as immutable
+    version: str
+
+
+def _load_asset(filename: str, media_type: str) -> _Asset:
+    """Read a static asset and precompute its compressed form and version."""
+    content = (_STATIC_DIR / filename).read_bytes()
+    return _Asset(
+        content=content,
+        gzipped=gzip.compress(content, mtime=0),
+        media_type=media_type,
+        version=hashlib.blake2b(content, digest_size=8).hexdigest()
+    )
+
+
+# Stylesheet and script, served separately so browsers cache them across renders
+_ASSETS = {
+    "config_page.css": _load_asset("config_page.css", "text/css"),
+    "config_page.js": _load_asset("config_page.js", "text/javascript"),
+}
+
+# Config values the page renders and their defaults, in _render argument order
+_PAGE_DEFAULTS = {
+    "analytics_enabled": True,
+    "weather_latitude": 40.0,
+    "weather_longitude": -111.8,
+    "weather_location_name": "Woodland Hills, Utah",
+    "analytics_overlay_style": "minimal",
+    "analytics_overlay_enabled": True,
+    "analytics_update_interval_minutes": 5,
+    "snow_detection_threshold": 0.7,
+    "ice_warning_temperature": 32,
+    "hazardous_snow_depth": 2.0,
+    "sequence_update_interval_minutes": 5,
+    "max_images_per_sequence": 10,
+    "gif_frame_duration_seconds": 1.0,
+    "gif_optimization_level": "balanced",
+}
+_get_page_values = itemgetter(*_PAGE_DEFAULTS)
+
+# Checkbox attribute placeholders, all unset; a render copies this and fills in
+# only the entries that apply
+_BLANK_ATTRS = {
+    "analytics_checked": "",
+    "overlay_checked": "",
+}
+
+# Document head; contains no dynamic values
+_STATIC_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Snow Load Analytics Configuration</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 800px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 300;
-        }}
-        
-        .header h2 {{
-            font-size: 1.2em;
-            opacity: 0.9;
-            font-weight: 300;
-        }}
-        
-        .content {{
-            padding: 40px;
-        }}
-        
-        .form-section {{
-            margin-bottom: 40px;
-            padding: 25px;
-            background: #f8f9fa;
-            border-radius: 10px;
-            border-left: 4px solid #3498db;
-        }}
-        
-        .form-section h3 {{
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 1.4em;
-            display: flex;
-            align-items: center;
-        }}
-        
-        .form-section h3::before {{
-            content: "⚙️";
-            margin-right: 10px;
-            font-size: 1.2em;
-        }}
-        
-        .form-group {{
-            margin-bottom: 20px;
-        }}
-        
-        .form-group label {{
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 600;
-            color: #34495e;
-        }}
-        
-        .form-group input, .form-group select {{
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            font-size: 16px;
-            transition: border-color 0.3s;
-        }}
-        
-        .form-group input:focus, .form-group select:focus {{
-            outline: none;
-            border-color: #3498db;
-            box-shadow: 0 0 0 3px rgba(52, 152, 219, 0.1);
-        }}
-        
-        .form-row {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-        }}
-        
-        .checkbox-group {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .checkbox-group input[type="checkbox"] {{
-            width: auto;
-            transform: scale(1.2);
-        }}
-        
-        .help-text {{
-            font-size: 0.9em;
-            color: #7f8c8d;
-            margin-top: 5px;
-        }}
-        
-        .button-group {{
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-            margin-top: 30px;
-        }}
-        
-        .btn {{
-            padding: 15px 30px;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s;
-            text-decoration: none;
-            display: inline-block;
-            text-align: center;
-        }}
-        
-        .btn-primary {{
-            background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
-            color: white;
-        }}
-        
-        .btn-primary:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(52, 152, 219, 0.3);
-        }}
-        
-        .btn-secondary {{
-            background: linear-gradient(135deg, #95a5a6 0%, #7f8c8d 100%);
-            color: white;
-        }}
-        
-        .btn-secondary:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(149, 165, 166, 0.3);
-        }}
-        
-        .btn-danger {{
-            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-            color: white;
-        }}
-        
-        .btn-danger:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(231, 76, 60, 0.3);
-        }}
-        
-        .status-message {{
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            font-weight: 600;
-            display: none;
-        }}
-        
-        .status-success {{
-            background: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }}
-        
-        .status-error {{
-            background: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }}
-        
-        .location-info {{
-            background: #e8f4fd;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            border-left: 4px solid #3498db;
-        }}
-        
-        .location-info h4 {{
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
-        
-        .coordinates {{
-            font-family: monospace;
-            background: white;
-            padding: 8px;
-            border-radius: 4px;
-            border: 1px solid #ddd;
-        }}
-        
-        @media (max-width: 768px) {{
-            .form-row {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .button-group {{
-                flex-direction: column;
-            }}
-            
-            .container {{
-                margin: 10px;
-            }}
-            
-            .content {{
-                padding: 20px;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="/static/config_page.css?v=""" + _ASSETS["config_page.css"].version + """">
 </head>
 <body>
-    <div class="container">
+"""
+
+# Form markup; str.format placeholders for the configurable values
+_BODY_TMPL = """    <div class="container">
         <div class="header">
             <h1>Snow Load Analytics</h1>
             <h2>Configuration Dashboard</h2>
@@ -289,7 +121,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="location-info">
                         <h4>Current Location</h4>
                         <p><strong>{location_name}</strong></p>
-                        <p class="coordinates">{weather_latitude}, {weather_longitude}</p>
+                        <p class="coordinates">{weather_latitude:.4f}, {weather_longitude:.4f}</p>
                     </div>
                     
                     <div class="form-group">
@@ -302,14 +134,14 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                         <div class="form-group">
                             <label for="weather_latitude">Latitude</label>
                             <input type="number" id="weather_latitude" name="weather_latitude" 
-                                   value="{weather_latitude}" step="0.0001" min="-90" max="90" required>
+                                   value="{weather_latitude:.4f}" step="0.0001" min="-90" max="90" required>
                             <div class="help-text">Latitude coordinate (-90 to 90)</div>
                         </div>
                         
                         <div class="form-group">
                             <label for="weather_longitude">Longitude</label>
                             <input type="number" id="weather_longitude" name="weather_longitude" 
-                                   value="{weather_longitude}" step="0.0001" min="-180" max="180" required>
+                                   value="{weather_longitude:.4f}" step="0.0001" min="-180" max="180" required>
                             <div class="help-text">Longitude coordinate (-180 to 180)</div>
                         </div>
                     </div>
@@ -322,7 +154,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <div class="checkbox-group">
                             <input type="checkbox" id="analytics_enabled" name="analytics_enabled" 
-                                   {"checked" if analytics_enabled else ""}>
+                                   {analytics_checked}>
                             <label for="analytics_enabled">Enable Snow Load Analytics</label>
                         </div>
                         <div class="help-text">Enable computer vision analysis of snow coverage and road conditions</div>
@@ -331,11 +163,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <label for="analytics_update_interval_minutes">Update Interval (minutes)</label>
                         <select id="analytics_update_interval_minutes" name="analytics_update_interval_minutes">
-                            <option value="1" {"selected" if update_interval == 1 else ""}>1 minute</option>
-                            <option value="5" {"selected" if update_interval == 5 else ""}>5 minutes</option>
-                            <option value="10" {"selected" if update_interval == 10 else ""}>10 minutes</option>
-                            <option value="15" {"selected" if update_interval == 15 else ""}>15 minutes</option>
-                            <option value="30" {"selected" if update_interval == 30 else ""}>30 minutes</option>
+                            {update_interval_options}
                         </select>
                         <div class="help-text">How often to update analytics data</div>
                     </div>
@@ -343,7 +171,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <label for="snow_detection_threshold">Snow Detection Threshold</label>
                         <input type="range" id="snow_detection_threshold" name="snow_detection_threshold" 
-                               value="{snow_threshold}" min="0" max="1" step="0.1">
+                               value="{snow_threshold:.1f}" min="0" max="1" step="0.1">
                         <div class="help-text">Sensitivity for snow detection (0.0 = very sensitive, 1.0 = less sensitive)</div>
                     </div>
                 </div>
@@ -355,7 +183,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <div class="checkbox-group">
                             <input type="checkbox" id="analytics_overlay_enabled" name="analytics_overlay_enabled" 
-                                   {"checked" if overlay_enabled else ""}>
+                                   {overlay_checked}>
                             <label for="analytics_overlay_enabled">Enable Analytics Overlays</label>
                         </div>
                         <div class="help-text">Show analytics data as overlays on camera images</div>
@@ -364,10 +192,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <label for="analytics_overlay_style">Overlay Style</label>
                         <select id="analytics_overlay_style" name="analytics_overlay_style">
-                            <option value="full" {"selected" if overlay_style == "full" else ""}>Full Analytics Panel</option>
-                            <option value="minimal" {"selected" if overlay_style == "minimal" else ""}>Minimal Timestamp</option>
-                            <option value="mobile" {"selected" if overlay_style == "mobile" else ""}>Mobile Optimized</option>
-                            <option value="none" {"selected" if overlay_style == "none" else ""}>No Overlay</option>
+                            {overlay_style_options}
                         </select>
                         <div class="help-text">Style of analytics overlay on images</div>
                     </div>
@@ -380,12 +205,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <label for="sequence_update_interval_minutes">GIF Update Interval (minutes)</label>
                         <select id="sequence_update_interval_minutes" name="sequence_update_interval_minutes">
-                            <option value="1" {"selected" if sequence_update_interval == 1 else ""}>1 minute</option>
-                            <option value="2" {"selected" if sequence_update_interval == 2 else ""}>2 minutes</option>
-                            <option value="5" {"selected" if sequence_update_interval == 5 else ""}>5 minutes</option>
-                            <option value="10" {"selected" if sequence_update_interval == 10 else ""}>10 minutes</option>
-                            <option value="15" {"selected" if sequence_update_interval == 15 else ""}>15 minutes</option>
-                            <option value="30" {"selected" if sequence_update_interval == 30 else ""}>30 minutes</option>
+                            {sequence_interval_options}
                         </select>
                         <div class="help-text">How often to generate and update the GIF sequence</div>
                     </div>
@@ -400,7 +220,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <label for="gif_frame_duration_seconds">Frame Duration (seconds)</label>
                         <input type="number" id="gif_frame_duration_seconds" name="gif_frame_duration_seconds" 
-                               value="{gif_frame_duration}" min="0.5" max="5.0" step="0.1">
+                               value="{gif_frame_duration:.1f}" min="0.5" max="5.0" step="0.1">
                         <div class="help-text">How long each frame displays in the GIF</div>
                     </div>
                     
@@ -418,9 +238,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                     <div class="form-group">
                         <label for="gif_optimization_level">Optimization Level</label>
                         <select id="gif_optimization_level" name="gif_optimization_level">
-                            <option value="low" {"selected" if gif_optimization == "low" else ""}>Low (256 colors, larger file)</option>
-                            <option value="balanced" {"selected" if gif_optimization == "balanced" else ""}>Balanced (192 colors, good quality)</option>
-                            <option value="aggressive" {"selected" if gif_optimization == "aggressive" else ""}>Aggressive (128 colors, smallest file)</option>
+                            {gif_optimization_options}
                         </select>
                         <div class="help-text">Balance between file size and image quality. All GIFs resized to 1280x720 for web.</div>
                     </div>
@@ -437,7 +255,7 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                         <div id="road-viz-container" style="margin-top: 15px; border: 2px solid #ddd; border-radius: 8px; padding: 15px; background: #f9f9f9;">
                             <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
                                 <span style="font-weight: bold; color: #333;">Live Road Detection & ROI Editor</span>
-                                <button type="button" onclick="refreshRoadVisualization()" class="btn btn-secondary" style="padding: 5px 15px;">
+                                <button type="button" data-action="refreshRoadVisualization" class="btn btn-secondary" style="padding: 5px 15px;">
                                     <span id="refresh-icon">↻</span> Refresh
                                 </button>
                             </div>
@@ -454,11 +272,9 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                             
                             <div style="position: relative; display: inline-block; width: 100%;">
                                 <img id="road-viz-image" 
-                                     src="/analytics/road-boundaries?mode=raw&t={int(datetime.now().timestamp())}" 
+                                     src="/analytics/road-boundaries?mode=raw" 
                                      alt="Road Boundary Visualization"
-                                     style="width: 100%; height: auto; border-radius: 4px; display: block; cursor: crosshair;"
-                                     onload="document.getElementById('viz-loading').style.display='none'; initializeROIEditor();"
-                                     onerror="showVizError();">
+                                     style="width: 100%; height: auto; border-radius: 4px; display: block; cursor: crosshair;">
                                 
                                 <canvas id="roi-overlay-canvas" 
                                         style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; pointer-events: none; z-index: 10;"></canvas>
@@ -501,10 +317,10 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                                 </div>
                                 
                                 <div style="display: flex; gap: 10px; flex-wrap: wrap; margin-bottom: 10px;">
-                                    <button type="button" onclick="clearROIPoints()" class="btn btn-secondary">Clear Points</button>
-                                    <button type="button" onclick="undoLastPoint()" class="btn btn-secondary">Undo Last</button>
-                                    <button type="button" onclick="loadCurrentROI()" class="btn btn-secondary">Load Saved ROI</button>
-                                    <button type="button" onclick="testROIVisualization()" class="btn btn-primary">Test ROI</button>
+                                    <button type="button" data-action="clearROIPoints" class="btn btn-secondary">Clear Points</button>
+                                    <button type="button" data-action="undoLastPoint" class="btn btn-secondary">Undo Last</button>
+                                    <button type="button" data-action="loadCurrentROI" class="btn btn-secondary">Load Saved ROI</button>
+                                    <button type="button" data-action="testROIVisualization" class="btn btn-primary">Test ROI</button>
                                 </div>
                                 
                                 <div id="roi-status" style="padding: 10px; background: white; border-radius: 4px; font-size: 14px;">
@@ -527,14 +343,14 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                         <div class="form-group">
                             <label for="ice_warning_temperature">Ice Warning Temperature (°F)</label>
                             <input type="number" id="ice_warning_temperature" name="ice_warning_temperature" 
-                                   value="{ice_temp}" min="-50" max="100" step="1">
+                                   value="{ice_temp:.0f}" min="-50" max="100" step="1">
                             <div class="help-text">Temperature below which ice warnings are issued</div>
                         </div>
                         
                         <div class="form-group">
                             <label for="hazardous_snow_depth">Hazardous Snow Depth (inches)</label>
                             <input type="number" id="hazardous_snow_depth" name="hazardous_snow_depth" 
-                                   value="{hazardous_depth}" min="0" max="50" step="0.1">
+                                   value="{hazardous_depth:.1f}" min="0" max="50" step="0.1">
                             <div class="help-text">Snow depth above which road is considered hazardous</div>
                         </div>
                     </div>
@@ -542,388 +358,135 @@ def create_config_page_html(config_data: Dict[str, Any]) -> str:
                 
                 <div class="button-group">
                     <button type="submit" class="btn btn-primary">Save Configuration</button>
-                    <button type="button" class="btn btn-secondary" onclick="resetToDefaults()">Reset to Defaults</button>
+                    <button type="button" class="btn btn-secondary" data-action="resetToDefaults">Reset to Defaults</button>
                     <a href="/" class="btn btn-secondary">Back to Monitor</a>
                 </div>
             </form>
         </div>
     </div>
     
-    <script>
-        // Show status message
-        function showStatus(message, type) {{
-            const statusDiv = document.getElementById('status-message');
-            statusDiv.textContent = message;
-            statusDiv.className = `status-message status-${{type}}`;
-            statusDiv.style.display = 'block';
-            
-            setTimeout(() => {{
-                statusDiv.style.display = 'none';
-            }}, 5000);
-        }}
-        
-        // Handle form submission
-        document.getElementById('config-form').addEventListener('submit', async function(e) {{
-            e.preventDefault();
-            
-            const formData = new FormData(e.target);
-            const config = Object.fromEntries(formData.entries());
-            
-            // Convert checkbox values
-            config.analytics_enabled = document.getElementById('analytics_enabled').checked;
-            config.analytics_overlay_enabled = document.getElementById('analytics_overlay_enabled').checked;
-            config.road_roi_enabled = document.getElementById('road_roi_enabled').checked;
-            
-            // Convert numeric values
-            config.weather_latitude = parseFloat(config.weather_latitude);
-            config.weather_longitude = parseFloat(config.weather_longitude);
-            config.analytics_update_interval_minutes = parseInt(config.analytics_update_interval_minutes);
-            config.snow_detection_threshold = parseFloat(config.snow_detection_threshold);
-            config.ice_warning_temperature = parseFloat(config.ice_warning_temperature);
-            config.hazardous_snow_depth = parseFloat(config.hazardous_snow_depth);
-            config.sequence_update_interval_minutes = parseInt(config.sequence_update_interval_minutes);
-            config.max_images_per_sequence = parseInt(config.max_images_per_sequence);
-            config.gif_frame_duration_seconds = parseFloat(config.gif_frame_duration_seconds);
-            
-            // Parse ROI points if present
-            if (config.road_roi_points) {{
-                try {{
-                    config.road_roi_points = JSON.parse(config.road_roi_points);
-                }} catch (e) {{
-                    console.error('Failed to parse ROI points:', e);
-                    config.road_roi_points = [];
-                }}
-            }}
-            
-            try {{
-                const response = await fetch('/config/analytics', {{
-                    method: 'POST',
-                    headers: {{
-                        'Content-Type': 'application/json',
-                    }},
-                    body: JSON.stringify(config)
-                }});
-                
-                const result = await response.json();
-                
-                if (result.status === 'success') {{
-                    showStatus('Configuration saved successfully!', 'success');
-                }} else {{
-                    showStatus(`Error: ${{result.message}}`, 'error');
-                }}
-            }} catch (error) {{
-                showStatus(`Error: ${{error.message}}`, 'error');
-            }}
-        }});
-        
-        // Reset to defaults
-        async function resetToDefaults() {{
-            if (confirm('Are you sure you want to reset all settings to defaults?')) {{
-                try {{
-                    const response = await fetch('/config/analytics/reset', {{
-                        method: 'POST'
-                    }});
-                    
-                    const result = await response.json();
-                    
-                    if (result.status === 'success') {{
-                        showStatus('Configuration reset to defaults!', 'success');
-                        setTimeout(() => {{
-                            location.reload();
-                        }}, 2000);
-                    }} else {{
-                        showStatus(`Error: ${{result.message}}`, 'error');
-                    }}
-                }} catch (error) {{
-                    showStatus(`Error: ${{error.message}}`, 'error');
-                }}
-            }}
-        }}
-        
-        // Update slider value display
-        document.getElementById('snow_detection_threshold').addEventListener('input', function(e) {{
-            const value = parseFloat(e.target.value);
-            e.target.nextElementSibling.textContent = 
-                `Sensitivity for snow detection (${{value.toFixed(1)}} - ${{value < 0.5 ? 'very sensitive' : value < 0.8 ? 'moderate' : 'less sensitive'}})`;
-        }});
-        
-        // Road visualization functions
-        function showVizError() {{
-            document.getElementById('road-viz-image').style.display = 'none';
-            document.getElementById('viz-loading').style.display = 'none';
-            document.getElementById('viz-error').style.display = 'block';
-        }}
-        
-        function refreshRoadVisualization() {{
-            const img = document.getElementById('road-viz-image');
-            const loading = document.getElementById('viz-loading');
-            const error = document.getElementById('viz-error');
-            const refreshIcon = document.getElementById('refresh-icon');
-            
-            // Show loading state
-            loading.style.display = 'block';
-            error.style.display = 'none';
-            img.style.display = 'none';
-            refreshIcon.style.display = 'inline-block';
-            refreshIcon.style.animation = 'spin 1s linear infinite';
-            
-            // Fetch new image with timestamp to prevent caching
-            const timestamp = new Date().getTime();
-            const newSrc = `/analytics/road-boundaries?mode=raw&t=${{timestamp}}`;
-            
-            // Fetch to get headers (metadata)
-            fetch(newSrc)
-                .then(response => {{
-                    if (!response.ok) throw new Error('Failed to load visualization');
-                    
-                    // Extract metadata from headers
-                    const roadPixels = response.headers.get('X-Road-Pixels') || 'N/A';
-                    const roadPercentage = response.headers.get('X-Road-Percentage') || 'N/A';
-                    const contours = response.headers.get('X-Contours-Detected') || 'N/A';
-                    const timestamp = response.headers.get('X-Timestamp') || new Date().toISOString();
-                    
-                    // Update metadata display
-                    document.getElementById('meta-pixels').textContent = roadPixels;
-                    document.getElementById('meta-percentage').textContent = roadPercentage + '%';
-                    document.getElementById('meta-contours').textContent = contours;
-                    document.getElementById('meta-timestamp').textContent = new Date(timestamp).toLocaleString();
-                    
-                    // Update image
-                    img.src = newSrc;
-                    img.style.display = 'block';
-                    loading.style.display = 'none';
-                    
-                    // Reinitialize ROI editor when image loads
-                    img.onload = function() {{
-                        initializeROIEditor();
-                    }};
-                    
-                    // Stop spin animation
-                    refreshIcon.style.animation = '';
-                }})
-                .catch(err => {{
-                    console.error('Road visualization error:', err);
-                    document.getElementById('viz-error-message').textContent = err.message;
-                    showVizError();
-                    refreshIcon.style.animation = '';
-                }});
-        }}
-        
-        // Load initial metadata on page load
-        window.addEventListener('load', function() {{
-            setTimeout(refreshRoadVisualization, 1000);
-        }});
-        
-        // Add CSS for spin animation
-        const style = document.createElement('style');
-        style.textContent = `
-            @keyframes spin {{
-                from {{ transform: rotate(0deg); }}
-                to {{ transform: rotate(360deg); }}
-            }}
-        `;
-        document.head.appendChild(style);
-        
-        // ROI Editor State
-        let roiPoints = [];
-        let roiOverlayCanvas = null;
-        let roiOverlayCtx = null;
-        let roadVizImage = null;
-        let imageScale = 1.0;
-        const MAX_POINTS = 12;
-        const MIN_POINTS = 4;
-        const POINT_RADIUS = 6;
-        const CLOSE_THRESHOLD = 20;
-
-        function initializeROIEditor() {{
-            roiOverlayCanvas = document.getElementById('roi-overlay-canvas');
-            roiOverlayCtx = roiOverlayCanvas.getContext('2d');
-            roadVizImage = document.getElementById('road-viz-image');
-            
-            // Set canvas size to match image display size
-            const imgRect = roadVizImage.getBoundingClientRect();
-            roiOverlayCanvas.width = imgRect.width;
-            roiOverlayCanvas.height = imgRect.height;
-            
-            // Calculate scale factor for coordinate conversion
-            imageScale = roadVizImage.naturalWidth / imgRect.width;
-            
-            // Load existing ROI if available
-            loadCurrentROI();
-            
-            // Add click handler to image
-            roadVizImage.addEventListener('click', handleROIImageClick);
-            
-            // Draw initial ROI overlay
-            redrawROIOverlay();
-        }}
-
-        function handleROIImageClick(event) {{
-            const rect = roadVizImage.getBoundingClientRect();
-            const x = event.clientX - rect.left;
-            const y = event.clientY - rect.top;
-            
-            // Check if clicking near first point to close polygon
-            if (roiPoints.length >= MIN_POINTS) {{
-                const firstPoint = roiPoints[0];
-                const dist = Math.sqrt(Math.pow(x - firstPoint.x, 2) + Math.pow(y - firstPoint.y, 2));
-                if (dist < CLOSE_THRESHOLD) {{
-                    // Close polygon
-                    updateROIStatus();
-                    redrawROIOverlay();
-                    return;
-                }}
-            }}
-            
-            // Add new point if under max
-            if (roiPoints.length < MAX_POINTS) {{
-                roiPoints.push({{x, y}});
-                updateROIStatus();
-                redrawROIOverlay();
-            }}
-        }}
-
-        function redrawROIOverlay() {{
-            if (!roiOverlayCtx) return;
-            
-            // Clear canvas
-            roiOverlayCtx.clearRect(0, 0, roiOverlayCanvas.width, roiOverlayCanvas.height);
-            
-            if (roiPoints.length === 0) return;
-            
-            // Draw polygon lines
-            roiOverlayCtx.strokeStyle = '#0066FF';
-            roiOverlayCtx.lineWidth = 3;
-            roiOverlayCtx.setLineDash([]);
-            roiOverlayCtx.beginPath();
-            roiOverlayCtx.moveTo(roiPoints[0].x, roiPoints[0].y);
-            for (let i = 1; i < roiPoints.length; i++) {{
-                roiOverlayCtx.lineTo(roiPoints[i].x, roiPoints[i].y);
-            }}
-            if (roiPoints.length >= MIN_POINTS) {{
-                roiOverlayCtx.closePath();
-            }}
-            roiOverlayCtx.stroke();
-            
-            // Draw semi-transparent fill if closed
-            if (roiPoints.length >= MIN_POINTS) {{
-                roiOverlayCtx.fillStyle = 'rgba(0, 102, 255, 0.15)';
-                roiOverlayCtx.fill();
-            }}
-            
-            // Draw points
-            roiPoints.forEach((point, index) => {{
-                roiOverlayCtx.fillStyle = index === 0 ? '#FF0000' : '#0066FF';
-                roiOverlayCtx.beginPath();
-                roiOverlayCtx.arc(point.x, point.y, POINT_RADIUS, 0, 2 * Math.PI);
-                roiOverlayCtx.fill();
-                roiOverlayCtx.strokeStyle = '#FFFFFF';
-                roiOverlayCtx.lineWidth = 2;
-                roiOverlayCtx.stroke();
-            }});
-        }}
-
-        function clearROIPoints() {{
-            roiPoints = [];
-            updateROIStatus();
-            redrawROIOverlay();
-        }}
-
-        function undoLastPoint() {{
-            if (roiPoints.length > 0) {{
-                roiPoints.pop();
-                updateROIStatus();
-                redrawROIOverlay();
-            }}
-        }}
-
-        function updateROIStatus() {{
-            const countEl = document.getElementById('roi-point-count');
-            const validEl = document.getElementById('roi-valid');
-            
-            countEl.textContent = roiPoints.length;
-            
-            if (roiPoints.length >= MIN_POINTS) {{
-                validEl.innerHTML = '<span style="color: green;">✓ Valid polygon</span>';
-            }} else if (roiPoints.length > 0) {{
-                validEl.innerHTML = '<span style="color: orange;">⚠ Need ' + (MIN_POINTS - roiPoints.length) + ' more points</span>';
-            }} else {{
-                validEl.innerHTML = '';
-            }}
-            
-            // Update hidden field with normalized coordinates
-            if (roiPoints.length >= MIN_POINTS && roadVizImage) {{
-                const normalized = roiPoints.map(p => [
-                    p.x * imageScale / roadVizImage.naturalWidth,
-                    p.y * imageScale / roadVizImage.naturalHeight
-                ]);
-                document.getElementById('road_roi_points').value = JSON.stringify(normalized);
-            }} else {{
-                document.getElementById('road_roi_points').value = '';
-            }}
-        }}
-
-        async function loadCurrentROI() {{
-            try {{
-                const response = await fetch('/config/analytics');
-                const result = await response.json();
-                
-                if (result.status === 'success' && result.config.road_roi_points) {{
-                    const normalized = result.config.road_roi_points;
-                    roiPoints = normalized.map(p => ({{
-                        x: p[0] * roadVizImage.naturalWidth / imageScale,
-                        y: p[1] * roadVizImage.naturalHeight / imageScale
-                    }}));
-                    
-                    document.getElementById('road_roi_enabled').checked = result.config.road_roi_enabled || false;
-                    
-                    updateROIStatus();
-                    redrawROIOverlay();
-                    showStatus('Loaded saved ROI', 'success');
-                }}
-            }} catch (error) {{
-                console.error('Failed to load ROI:', error);
-            }}
-        }}
-
-        async function testROIVisualization() {{
-            if (roiPoints.length < MIN_POINTS) {{
-                showStatus('Please define at least 4 points', 'error');
-                return;
-            }}
-            
-            // Save temporarily to test
-            const config = {{
-                road_roi_points: roiPoints.map(p => [
-                    p.x * imageScale / roadVizImage.naturalWidth,
-                    p.y * imageScale / roadVizImage.naturalHeight
-                ]),
-                road_roi_enabled: true
-            }};
-            
-            try {{
-                await fetch('/config/analytics', {{
-                    method: 'POST',
-                    headers: {{'Content-Type': 'application/json'}},
-                    body: JSON.stringify(config)
-                }});
-                
-                // Refresh visualization
-                setTimeout(() => refreshRoadVisualization(), 500);
-                showStatus('Testing ROI - check visualization below', 'success');
-            }} catch (error) {{
-                showStatus('Test failed: ' + error.message, 'error');
-            }}
-        }}
-
-        // Update form submission to include ROI data
-        document.getElementById('config-form').addEventListener('submit', function(e) {{
-            // Ensure ROI points are up to date in hidden field
-            updateROIStatus();
-        }});
-    </script>
+"""
+
+# Page script, linked at the end of the body; contains no dynamic values
+_STATIC_TAIL = """    <script src="/static/config_page.js?v=""" + _ASSETS["config_page.js"].version + """"></script>
 </body>
 </html>
 """
+
+# Identifies the template revision in config page ETags
+_TEMPLATE_FINGERPRINT = hashlib.blake2b(
+    (_STATIC_HEAD + _BODY_TMPL + _STATIC_TAIL).encode("utf-8"), digest_size=8
+).digest()
+
+
+def config_page_asset(filename: str, gzipped: bool = False) -> Optional[Tuple[bytes, str]]:
+    """
+    Look up a static config page asset.
+    
+    Args:
+        filename: Asset file name, e.g. "config_page.css"
+        gzipped: Return the gzip-compressed content
+        
+    Returns:
+        (content, media_type), or None if there is no such asset
+    """
+    asset = _ASSETS.get(filename)
+    if asset is None:
+        return None
+    return (asset.gzipped if gzipped else asset.content), asset.media_type
+
+
+@lru_cache(maxsize=32)
+def _options_html(options: tuple, selected: Any) -> str:
+    """Build the <option> lines of a select control with the current value selected."""
+    return _OPTION_SEPARATOR.join(
+        f'<option value="{value}" {"selected" if value == selected else ""}>{label}</option>'
+        for value, label in options
+    )
+
+
+@lru_cache(maxsize=32, typed=True)
+def _render(
+    analytics_enabled: bool,
+    weather_latitude: float,
+    weather_longitude: float,
+    location_name: str,
+    overlay_style: str,
+    overlay_enabled: bool,
+    update_interval: int,
+    snow_threshold: float,
+    ice_temp: int,
+    hazardous_depth: float,
+    sequence_update_interval: int,
+    max_images: int,
+    gif_frame_duration: float,
+    gif_optimization: str
+) -> Tuple[str, bytes, bytes]:
+    """
+    Render the page for one set of config values.
+    
+    Returns:
+        The page HTML, its UTF-8 encoding and the gzip-compressed encoding
+    """
+    # Calculate capture interval for display
+    capture_interval = (sequence_update_interval * 60) / max_images if max_images > 0 else 30
     
-    return html
+    values = dict(_BLANK_ATTRS)
+    values.update(
+        # The only free-text value; escaped since it lands in markup and an attribute
+        location_name=html.escape(location_name),
+        weather_latitude=weather_latitude,
+        weather_longitude=weather_longitude,
+        snow_threshold=snow_threshold,
+        ice_temp=ice_temp,
+        hazardous_depth=hazardous_depth,
+        max_images=max_images,
+        gif_frame_duration=gif_frame_duration,
+        capture_interval=capture_interval,
+        update_interval_options=_options_html(_UPDATE_INTERVAL_OPTIONS, update_interval),
+        sequence_interval_options=_options_html(_SEQUENCE_INTERVAL_OPTIONS, sequence_update_interval),
+        overlay_style_options=_options_html(_OVERLAY_STYLE_OPTIONS, overlay_style),
+        gif_optimization_options=_options_html(_GIF_OPTIMIZATION_OPTIONS, gif_optimization),
+    )
+    
+    if analytics_enabled:
+        values["analytics_checked"] = "checked"
+    if overlay_enabled:
+        values["overlay_checked"] = "checked"
+    
+    page = _STATIC_HEAD + _BODY_TMPL.format_map(values) + _STATIC_TAIL
+    encoded = page.encode("utf-8")
+    return page, encoded, gzip.compress(encoded, compresslevel=6, mtime=0)
+
+
+def _page_values(config_data: Dict[str, Any]) -> tuple:
+    """Extract the config values the page depends on, in _render argument order."""
+    return _get_page_values(_PAGE_DEFAULTS | config_data)
+
+
+def create_config_page_html(config_data: Dict[str, Any]) -> str:
+    """Create the analytics configuration page HTML."""
+    return _render(*_page_values(config_data))[0]
+
+
+def create_config_page_bytes(config_data: Dict[str, Any], gzipped: bool = False) -> bytes:
+    """Create the analytics configuration page as UTF-8 bytes, optionally gzip-compressed."""
+    return _render(*_page_values(config_data))[2 if gzipped else 1]
+
+
+def config_page_etag(config_data: Dict[str, Any]) -> str:
+    """
+    Weak ETag for the config page.
+    
+    Derived from the page template and the config values it renders, so it
+    changes whenever either would change the page.
+    """
+    return _etag_for(_page_values(config_data))
+
+
+@lru_cache(maxsize=32, typed=True)
+def _etag_for(values: tuple) -> str:
+    """Hash the template fingerprint and page values into a weak ETag."""
+    digest = hashlib.blake2b(_TEMPLATE_FINGERPRINT, digest_size=8)
+    digest.update(repr(values).encode("utf-8"))
+    return f'W/"{digest.hexdigest()}"'
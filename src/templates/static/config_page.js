@@ -0,0 +1,468 @@
+// Show status message
+function showStatus(message, type) {
+    const statusDiv = document.getElementById('status-message');
+    statusDiv.textContent = message;
+    statusDiv.className = `status-message status-${type}`;
+    statusDiv.style.display = 'block';
+
+    setTimeout(() => {
+        statusDiv.style.display = 'none';
+    }, 5000);
+}
+
+// Form fields that are submitted as something other than strings
+const CHECKBOX_FIELDS = ['analytics_enabled', 'analytics_overlay_enabled', 'road_roi_enabled'];
+const NUMERIC_FIELDS = {
+    weather_latitude: parseFloat,
+    weather_longitude: parseFloat,
+    analytics_update_interval_minutes: parseInt,
+    snow_detection_threshold: parseFloat,
+    ice_warning_temperature: parseFloat,
+    hazardous_snow_depth: parseFloat,
+    sequence_update_interval_minutes: parseInt,
+    max_images_per_sequence: parseInt,
+    gif_frame_duration_seconds: parseFloat
+};
+
+// Handle form submission
+document.getElementById('config-form').addEventListener('submit', async function(e) {
+    e.preventDefault();
+
+    // Write the ROI points into their hidden field before reading the form
+    serializeROI();
+    const formData = new FormData(e.target);
+    const config = Object.fromEntries(formData.entries());
+
+    // Convert checkbox and numeric values
+    for (const field of CHECKBOX_FIELDS) {
+        config[field] = document.getElementById(field).checked;
+    }
+    for (const [field, parse] of Object.entries(NUMERIC_FIELDS)) {
+        config[field] = parse(config[field]);
+    }
+
+    // Parse ROI points if present
+    if (config.road_roi_points) {
+        try {
+            config.road_roi_points = JSON.parse(config.road_roi_points);
+        } catch (e) {
+            console.error('Failed to parse ROI points:', e);
+            config.road_roi_points = [];
+        }
+    }
+
+    try {
+        const response = await fetch('/config/analytics', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(config)
+        });
+
+        const result = await response.json();
+
+        if (result.status === 'success') {
+            showStatus('Configuration saved successfully!', 'success');
+        } else {
+            showStatus(`Error: ${result.message}`, 'error');
+        }
+    } catch (error) {
+        showStatus(`Error: ${error.message}`, 'error');
+    }
+});
+
+// Reset to defaults
+async function resetToDefaults() {
+    if (confirm('Are you sure you want to reset all settings to defaults?')) {
+        try {
+            const response = await fetch('/config/analytics/reset', {
+                method: 'POST'
+            });
+
+            const result = await response.json();
+
+            if (result.status === 'success') {
+                showStatus('Configuration reset to defaults!', 'success');
+                setTimeout(() => {
+                    location.reload();
+                }, 2000);
+            } else {
+                showStatus(`Error: ${result.message}`, 'error');
+            }
+        } catch (error) {
+            showStatus(`Error: ${error.message}`, 'error');
+        }
+    }
+}
+
+// Update slider value display
+document.getElementById('snow_detection_threshold').addEventListener('input', function(e) {
+    const value = parseFloat(e.target.value);
+    e.target.nextElementSibling.textContent = 
+        `Sensitivity for snow detection (${value.toFixed(1)} - ${value < 0.5 ? 'very sensitive' : value < 0.8 ? 'moderate' : 'less sensitive'})`;
+});
+
+// Road visualization functions
+function showVizError() {
+    document.getElementById('road-viz-image').style.display = 'none';
+    document.getElementById('viz-loading').style.display = 'none';
+    document.getElementById('viz-error').style.display = 'block';
+}
+
+// Refresh in progress, shared by overlapping refresh requests
+let vizRefreshInFlight = null;
+// Object URL of the image currently shown, revoked when replaced
+let vizObjectUrl = null;
+
+function refreshRoadVisualization() {
+    if (vizRefreshInFlight) return vizRefreshInFlight;
+
+    const img = document.getElementById('road-viz-image');
+    const loading = document.getElementById('viz-loading');
+    const error = document.getElementById('viz-error');
+    const refreshIcon = document.getElementById('refresh-icon');
+
+    // Show loading state
+    loading.style.display = 'block';
+    error.style.display = 'none';
+    img.style.display = 'none';
+    refreshIcon.style.display = 'inline-block';
+    refreshIcon.style.animation = 'spin 1s linear infinite';
+
+    // Fetch new image with timestamp to prevent caching
+    const timestamp = new Date().getTime();
+    const newSrc = `/analytics/road-boundaries?mode=raw&t=${timestamp}`;
+
+    // Fetch once for both the metadata headers and the image itself
+    vizRefreshInFlight = fetch(newSrc)
+        .then(async response => {
+            if (!response.ok) throw new Error('Failed to load visualization');
+
+            // Extract metadata from headers
+            const roadPixels = response.headers.get('X-Road-Pixels') || 'N/A';
+            const roadPercentage = response.headers.get('X-Road-Percentage') || 'N/A';
+            const contours = response.headers.get('X-Contours-Detected') || 'N/A';
+            const timestamp = response.headers.get('X-Timestamp') || new Date().toISOString();
+
+            // Update metadata display
+            document.getElementById('meta-pixels').textContent = roadPixels;
+            document.getElementById('meta-percentage').textContent = roadPercentage + '%';
+            document.getElementById('meta-contours').textContent = contours;
+            document.getElementById('meta-timestamp').textContent = new Date(timestamp).toLocaleString();
+
+            // Update image from the fetched body instead of downloading it again
+            const blob = await response.blob();
+            if (vizObjectUrl) URL.revokeObjectURL(vizObjectUrl);
+            vizObjectUrl = URL.createObjectURL(blob);
+            img.src = vizObjectUrl;
+            img.style.display = 'block';
+            loading.style.display = 'none';
+
+            // Reinitialize ROI editor when image loads
+            img.onload = function() {
+                initializeROIEditor();
+            };
+
+            // Stop spin animation
+            refreshIcon.style.animation = '';
+        })
+        .catch(err => {
+            console.error('Road visualization error:', err);
+            document.getElementById('viz-error-message').textContent = err.message;
+            showVizError();
+            refreshIcon.style.animation = '';
+        })
+        .finally(() => {
+            vizRefreshInFlight = null;
+        });
+    return vizRefreshInFlight;
+}
+
+// Load initial metadata on page load
+window.addEventListener('load', function() {
+    setTimeout(refreshRoadVisualization, 1000);
+});
+
+// Add CSS for spin animation
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes spin {
+        from { transform: rotate(0deg); }
+        to { transform: rotate(360deg); }
+    }
+`;
+document.head.appendChild(style);
+
+// ROI Editor State
+let roiPoints = [];
+let roiOverlayCanvas = null;
+let roiOverlayCtx = null;
+let roadVizImage = null;
+let imageScale = 1.0;
+const MAX_POINTS = 12;
+const MIN_POINTS = 4;
+const POINT_RADIUS = 6;
+const CLOSE_THRESHOLD = 20;
+
+function initializeROIEditor() {
+    roiOverlayCanvas = document.getElementById('roi-overlay-canvas');
+    roiOverlayCtx = roiOverlayCanvas.getContext('2d');
+    roadVizImage = document.getElementById('road-viz-image');
+
+    // Set canvas size to match image display size
+    const imgRect = roadVizImage.getBoundingClientRect();
+    roiOverlayCanvas.width = imgRect.width;
+    roiOverlayCanvas.height = imgRect.height;
+
+    // Calculate scale factor for coordinate conversion
+    imageScale = roadVizImage.naturalWidth / imgRect.width;
+
+    // Load existing ROI if available
+    loadCurrentROI();
+
+    // Add click handler to image
+    roadVizImage.addEventListener('click', handleROIImageClick);
+
+    // Draw initial ROI overlay
+    scheduleROIRedraw();
+}
+
+function handleROIImageClick(event) {
+    // Offsets are relative to the image, so no layout read is needed per click
+    const x = event.offsetX;
+    const y = event.offsetY;
+
+    // Check if clicking near first point to close polygon
+    if (roiPoints.length >= MIN_POINTS) {
+        const firstPoint = roiPoints[0];
+        const dist = Math.sqrt(Math.pow(x - firstPoint.x, 2) + Math.pow(y - firstPoint.y, 2));
+        if (dist < CLOSE_THRESHOLD) {
+            // Close polygon
+            updateROIStatus();
+            scheduleROIRedraw();
+            return;
+        }
+    }
+
+    // Add new point if under max; whole pixels keep canvas drawing off the
+    // sub-pixel antialiasing path
+    if (roiPoints.length < MAX_POINTS) {
+        roiPoints.push({x: Math.round(x), y: Math.round(y)});
+        updateROIStatus();
+        scheduleROIRedraw();
+    }
+}
+
+// Coalesce redraw requests so several ROI changes in one frame paint once
+let roiRedrawPending = false;
+
+function scheduleROIRedraw() {
+    if (roiRedrawPending) return;
+    roiRedrawPending = true;
+    requestAnimationFrame(function() {
+        roiRedrawPending = false;
+        drawROIOverlay();
+    });
+}
+
+// Region covered by the last overlay paint, so only that area is cleared
+let roiDrawnBounds = null;
+// Margin around the points that covers the marker radius and outline stroke
+const ROI_BOUNDS_PADDING = POINT_RADIUS + 3;
+
+function drawROIOverlay() {
+    if (!roiOverlayCtx) return;
+
+    // Clear what the previous paint covered
+    if (roiDrawnBounds) {
+        roiOverlayCtx.clearRect(roiDrawnBounds.x, roiDrawnBounds.y, roiDrawnBounds.width, roiDrawnBounds.height);
+        roiDrawnBounds = null;
+    }
+
+    if (roiPoints.length === 0) return;
+
+    const xs = roiPoints.map(point => point.x);
+    const ys = roiPoints.map(point => point.y);
+    const minX = Math.min(...xs) - ROI_BOUNDS_PADDING;
+    const minY = Math.min(...ys) - ROI_BOUNDS_PADDING;
+    roiDrawnBounds = {
+        x: minX,
+        y: minY,
+        width: Math.max(...xs) + ROI_BOUNDS_PADDING - minX,
+        height: Math.max(...ys) + ROI_BOUNDS_PADDING - minY
+    };
+
+    // Draw polygon lines
+    roiOverlayCtx.strokeStyle = '#0066FF';
+    roiOverlayCtx.lineWidth = 3;
+    roiOverlayCtx.setLineDash([]);
+    roiOverlayCtx.beginPath();
+    roiOverlayCtx.moveTo(roiPoints[0].x, roiPoints[0].y);
+    for (let i = 1; i < roiPoints.length; i++) {
+        roiOverlayCtx.lineTo(roiPoints[i].x, roiPoints[i].y);
+    }
+    if (roiPoints.length >= MIN_POINTS) {
+        roiOverlayCtx.closePath();
+    }
+    roiOverlayCtx.stroke();
+
+    // Draw semi-transparent fill if closed
+    if (roiPoints.length >= MIN_POINTS) {
+        roiOverlayCtx.fillStyle = 'rgba(0, 102, 255, 0.15)';
+        roiOverlayCtx.fill();
+    }
+
+    // Draw points: the first one in red, then the rest batched into one path
+    roiOverlayCtx.strokeStyle = '#FFFFFF';
+    roiOverlayCtx.lineWidth = 2;
+    roiOverlayCtx.fillStyle = '#FF0000';
+    roiOverlayCtx.beginPath();
+    roiOverlayCtx.arc(roiPoints[0].x, roiPoints[0].y, POINT_RADIUS, 0, 2 * Math.PI);
+    roiOverlayCtx.fill();
+    roiOverlayCtx.stroke();
+
+    if (roiPoints.length > 1) {
+        roiOverlayCtx.fillStyle = '#0066FF';
+        roiOverlayCtx.beginPath();
+        for (let i = 1; i < roiPoints.length; i++) {
+            const point = roiPoints[i];
+            // Start each circle on its own subpath so no joining lines are drawn
+            roiOverlayCtx.moveTo(point.x + POINT_RADIUS, point.y);
+            roiOverlayCtx.arc(point.x, point.y, POINT_RADIUS, 0, 2 * Math.PI);
+        }
+        roiOverlayCtx.fill();
+        roiOverlayCtx.stroke();
+    }
+}
+
+function clearROIPoints() {
+    roiPoints = [];
+    updateROIStatus();
+    scheduleROIRedraw();
+}
+
+function undoLastPoint() {
+    if (roiPoints.length > 0) {
+        roiPoints.pop();
+        updateROIStatus();
+        scheduleROIRedraw();
+    }
+}
+
+function updateROIStatus() {
+    const countEl = document.getElementById('roi-point-count');
+    const validEl = document.getElementById('roi-valid');
+
+    countEl.textContent = roiPoints.length;
+
+    if (roiPoints.length >= MIN_POINTS) {
+        validEl.innerHTML = '<span style="color: green;">✓ Valid polygon</span>';
+    } else if (roiPoints.length > 0) {
+        validEl.innerHTML = '<span style="color: orange;">⚠ Need ' + (MIN_POINTS - roiPoints.length) + ' more points</span>';
+    } else {
+        validEl.innerHTML = '';
+    }
+}
+
+// ROI points as image-relative coordinates in 0.0-1.0
+function normalizedROIPoints() {
+    const scaleX = imageScale / roadVizImage.naturalWidth;
+    const scaleY = imageScale / roadVizImage.naturalHeight;
+    return roiPoints.map(p => [p.x * scaleX, p.y * scaleY]);
+}
+
+// Update hidden field with normalized coordinates; only needed when submitting
+function serializeROI() {
+    const field = document.getElementById('road_roi_points');
+    if (roiPoints.length >= MIN_POINTS && roadVizImage) {
+        field.value = JSON.stringify(normalizedROIPoints());
+    } else {
+        field.value = '';
+    }
+}
+
+async function loadCurrentROI() {
+    try {
+        const response = await fetch('/config/analytics');
+        const result = await response.json();
+
+        if (result.status === 'success' && result.config.road_roi_points) {
+            const normalized = result.config.road_roi_points;
+            const scaleX = roadVizImage.naturalWidth / imageScale;
+            const scaleY = roadVizImage.naturalHeight / imageScale;
+            roiPoints = normalized.map(p => ({
+                x: Math.round(p[0] * scaleX),
+                y: Math.round(p[1] * scaleY)
+            }));
+
+            document.getElementById('road_roi_enabled').checked = result.config.road_roi_enabled || false;
+
+            updateROIStatus();
+            scheduleROIRedraw();
+            showStatus('Loaded saved ROI', 'success');
+        }
+    } catch (error) {
+        console.error('Failed to load ROI:', error);
+    }
+}
+
+async function testROIVisualization() {
+    if (roiPoints.length < MIN_POINTS) {
+        showStatus('Please define at least 4 points', 'error');
+        return;
+    }
+
+    // Save temporarily to test
+    const config = {
+        road_roi_points: normalizedROIPoints(),
+        road_roi_enabled: true
+    };
+
+    try {
+        await fetch('/config/analytics', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(config)
+        });
+
+        // Refresh visualization
+        setTimeout(() => refreshRoadVisualization(), 500);
+        showStatus('Testing ROI - check visualization below', 'success');
+    } catch (error) {
+        showStatus('Test failed: ' + error.message, 'error');
+    }
+}
+
+// Button handlers, dispatched from one listener by data-action attribute
+const ACTIONS = {
+    refreshRoadVisualization,
+    clearROIPoints,
+    undoLastPoint,
+    loadCurrentROI,
+    testROIVisualization,
+    resetToDefaults
+};
+
+document.addEventListener('click', function(e) {
+    const target = e.target.closest('[data-action]');
+    if (target && ACTIONS[target.dataset.action]) {
+        ACTIONS[target.dataset.action](e);
+    }
+});
+
+// Initial visualization image; it may have loaded or failed before this script ran
+function onInitialVizLoad() {
+    document.getElementById('viz-loading').style.display = 'none';
+    initializeROIEditor();
+}
+
+const initialVizImage = document.getElementById('road-viz-image');
+initialVizImage.onerror = showVizError;
+if (!initialVizImage.complete) {
+    initialVizImage.onload = onInitialVizLoad;
+} else if (initialVizImage.naturalWidth > 0) {
+    onInitialVizLoad();
+} else {
+    showVizError();
+}
@@ -4,17 +4,48 @@ Logging configuration for Image Sequence Server.
 Provides structured logging with security considerations.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import structlog
 
+# Writes queued log records to the real handlers on a background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
-def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None):
-    """Configure structured logging with security best practices."""
+
+def _orjson_dumps(obj, default=None) -> str:
+    """Serialize a log event with orjson; the stdlib logger needs str, not bytes."""
+    return orjson.dumps(obj, default=default).decode()
+
+
+def _stop_queue_listener():
+    """Stop the active queue listener, flushing any records still queued."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None, queued: bool = True):
+    """
+    Configure structured logging with security best practices.
+    
+    Args:
+        log_level: Minimum level to log
+        log_file: Optional rotating log file
+        queued: Write records from a background listener thread; worker
+            processes pass False and write directly, since they may exit
+            without running atexit hooks
+    """
     
     # Configure structlog
     structlog.configure(
@@ -27,7 +58,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None):
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -35,16 +66,36 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None):
         cache_logger_on_first_use=True,
     )
     
-    # Configure standard logging
+    # Configure standard logging; the event loop only enqueues records, and
+    # console/file writes (including rotation) happen on the listener thread
+    global _queue_listener
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=10*1024*1024, backupCount=5
+        ))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Reconfiguring replaces the previous listener (and, via force=True below,
+    # the root handler that fed it)
+    _stop_queue_listener()
+    if queued:
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        
+        # The queue handler only renders the message; the listener's handlers
+        # add the timestamp/level prefix
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers = [queue_handler]
+    
     logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         level=getattr(logging, log_level.upper()),
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.handlers.RotatingFileHandler(
-                log_file, maxBytes=10*1024*1024, backupCount=5
-            ) if log_file else logging.NullHandler()
-        ]
+        handlers=handlers,
+        force=True
     )
     
     # Security: Don't log sensitive information